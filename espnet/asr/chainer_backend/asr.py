@@ -506,6 +506,7 @@ def recog(args):
     model = model_class(idim, odim, train_args)
     assert isinstance(model, ASRInterface)
     chainer_load(args.model, model)
+    model.finalize_for_inference(dtype=getattr(args, "dtype", "float32"))
 
     # read rnnlm
     if args.rnnlm:
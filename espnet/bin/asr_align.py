@@ -41,6 +41,8 @@ Selected parameters:
         with the option `--gratis-blank`.
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import configargparse
 import logging
 import os
@@ -87,6 +89,12 @@ def get_parser():
         choices=["pytorch"],
         help="Backend library",
     )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=1,
+        help="Number of processes for CTC segmentation of the audio files",
+    )
     parser.add_argument("--debugmode", type=int, default=1, help="Debugmode")
     parser.add_argument("--verbose", "-V", type=int, default=1, help="Verbose option")
     parser.add_argument(
@@ -225,6 +233,25 @@ def main(args):
     sys.exit(0)
 
 
+def align_utterances(config, lpz, text):
+    """Align the utterances within a single audio file.
+
+    :param config: CTC segmentation configuration
+    :param lpz: CTC log posterior probabilities of the audio file
+    :param text: list of the utterances of the audio file
+    :return: list of segments as (start, end, confidence score)
+    """
+    # Prepare the text for aligning
+    ground_truth_mat, utt_begin_indices = prepare_text(config, text)
+    # Align using CTC segmentation
+    timings, char_probs, state_list = ctc_segmentation(config, lpz, ground_truth_mat)
+    logging.debug(f"state_list = {state_list}")
+    # Obtain list of utterances with time intervals and confidence score
+    return determine_utterance_segments(
+        config, utt_begin_indices, char_probs, timings, text
+    )
+
+
 def ctc_align(args, device):
     """ESPnet-specific interface for CTC segmentation.
 
@@ -318,28 +345,8 @@ def ctc_align(args, device):
     if args.scoring_length is not None:
         config.score_min_mean_over_L = args.scoring_length
     logging.info(f"Frame timings: {frame_duration_ms}ms * {subsampling_factor}")
-    # Iterate over audio files to decode and align
-    for idx, name in enumerate(js.keys(), 1):
-        logging.info("(%d/%d) Aligning " + name, idx, len(js.keys()))
-        batch = [(name, js[name])]
-        feat, label = load_inputs_and_targets(batch)
-        feat = feat[0]
-        with torch.no_grad():
-            # Encode input frames
-            enc_output = model.encode(torch.as_tensor(feat).to(device)).unsqueeze(0)
-            # Apply ctc layer to obtain log character probabilities
-            lpz = model.ctc.log_softmax(enc_output)[0].cpu().numpy()
-        # Prepare the text for aligning
-        ground_truth_mat, utt_begin_indices = prepare_text(config, text[name])
-        # Align using CTC segmentation
-        timings, char_probs, state_list = ctc_segmentation(
-            config, lpz, ground_truth_mat
-        )
-        logging.debug(f"state_list = {state_list}")
-        # Obtain list of utterances with time intervals and confidence score
-        segments = determine_utterance_segments(
-            config, utt_begin_indices, char_probs, timings, text[name]
-        )
+
+    def write_segments(name, segments):
         # Write to "segments" file
         for i, boundary in enumerate(segments):
             utt_segment = (
@@ -347,6 +354,44 @@ def ctc_align(args, device):
                 f" {boundary[1]:.2f} {boundary[2]:.9f}\n"
             )
             args.output.write(utt_segment)
+
+    # The audio files are aligned in worker processes while the model infers
+    # the posteriors of the following ones. The segments are written in order.
+    executor = None
+    if args.num_workers > 1:
+        executor = ProcessPoolExecutor(max_workers=args.num_workers)
+    pending = deque()
+    try:
+        # Iterate over audio files to decode and align
+        for idx, name in enumerate(js.keys(), 1):
+            logging.info("(%d/%d) Aligning " + name, idx, len(js.keys()))
+            batch = [(name, js[name])]
+            feat, label = load_inputs_and_targets(batch)
+            feat = feat[0]
+            with torch.no_grad():
+                # Encode input frames
+                enc_output = model.encode(torch.as_tensor(feat).to(device)).unsqueeze(0)
+                # Apply ctc layer to obtain log character probabilities
+                lpz = model.ctc.log_softmax(enc_output)[0].cpu().numpy()
+            if executor is None:
+                write_segments(name, align_utterances(config, lpz, text[name]))
+                continue
+            pending.append(
+                (name, executor.submit(align_utterances, config, lpz, text[name]))
+            )
+            # Bound the number of the posteriors held for the workers
+            while len(pending) > 2 * args.num_workers:
+                name, future = pending.popleft()
+                write_segments(name, future.result())
+        while len(pending) > 0:
+            name, future = pending.popleft()
+            write_segments(name, future.result())
+    finally:
+        # Release the workers and the posteriors of the pending files on errors
+        for _, future in pending:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown()
     return 0
 
 
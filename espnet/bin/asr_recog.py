@@ -46,7 +46,8 @@ def get_parser():
         "--dtype",
         choices=("float16", "float32", "float64"),
         default="float32",
-        help="Float precision (only available in --api v2)",
+        help="Float precision (only available in --api v2 "
+        "or the chainer transformer decoder)",
     )
     parser.add_argument(
         "--backend",
@@ -37,6 +37,12 @@ def get_parser():
     )
 
     parser.add_argument("--ngpu", default=0, type=int, help="Number of GPUs")
+    parser.add_argument(
+        "--dtype",
+        choices=("float16", "bfloat16", "float32"),
+        default="float32",
+        help="Float precision of the autocast region used for decoding",
+    )
     parser.add_argument(
         "--backend",
         default="pytorch",
@@ -111,6 +117,28 @@ def get_parser():
         type=strtobool,
         help="Whether to save focus rates of attentions",
     )
+    parser.add_argument(
+        "--fuse-conv-bn",
+        default=False,
+        type=strtobool,
+        help="Whether to fold batch normalization into the convolution layers "
+        "(Tacotron2 only)",
+    )
+    # quantize model related
+    parser.add_argument(
+        "--quantize-config",
+        nargs="*",
+        help="Quantize config list. E.g.: --quantize-config=[Linear,LSTM,LSTMCell]",
+    )
+    parser.add_argument(
+        "--quantize-dtype", type=str, default="qint8", help="Dtype dynamic quantize"
+    )
+    parser.add_argument(
+        "--quantize-tts-model",
+        default=False,
+        type=strtobool,
+        help="Whether to dynamically quantize the tts model (CPU only)",
+    )
     return parser
 
 
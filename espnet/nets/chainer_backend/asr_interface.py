@@ -22,6 +22,21 @@ class ChainerASRInterface(ASRInterface, chainer.Chain):
         """Get custom_parallel_updater of the model (Chainer only)."""
         raise NotImplementedError("custom parallel updater method is not implemented")
 
+    def finalize_for_inference(self, dtype="float32"):
+        """Prepare the trained parameters for decoding (Chainer only).
+
+        Models may fold training-time operations into their parameters here.
+        It is called once after loading a snapshot for decoding.
+
+        Args:
+            dtype (str): Float precision used for decoding.
+
+        """
+        if dtype != "float32":
+            raise NotImplementedError(
+                f"--dtype {dtype} is not supported by {self.__class__.__name__}"
+            )
+
     def get_total_subsampling_factor(self):
         """Get total subsampling factor."""
         raise NotImplementedError(
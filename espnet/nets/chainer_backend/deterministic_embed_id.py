@@ -1,5 +1,4 @@
 import numpy
-import six
 
 import chainer
 from chainer import cuda
@@ -84,7 +83,7 @@ class EmbedIDGrad(function_node.FunctionNode):
         if xp is numpy:
             # It is equivalent to `numpy.add.at(gW, x, gy)` but ufunc.at is
             # too slow.
-            for ix, igy in six.moves.zip(x.ravel(), gy.reshape(x.size, -1)):
+            for ix, igy in zip(x.ravel(), gy.reshape(x.size, -1)):
                 if ix == self.ignore_label:
                     continue
                 gW[ix] += igy
@@ -10,7 +10,6 @@ import chainer
 import chainer.functions as F
 from chainer import reporter
 import numpy as np
-import six
 
 from espnet.nets.chainer_backend.asr_interface import ChainerASRInterface
 from espnet.nets.chainer_backend.transformer.attention import MultiHeadAttention
@@ -36,6 +35,23 @@ CTC_SCORING_RATIO = 1.5
 MAX_DECODER_OUTPUT = 5
 
 
+def topk_ids(xp, scores, k):
+    """Get the ids of the k best scores in descending order.
+
+    Args:
+        xp (module): numpy or cupy.
+        scores (ndarray): Scores with dimensions (V,).
+        k (int): Number of ids to keep.
+
+    Returns:
+        ndarray: Ids of the k best scores. (k,)
+
+    """
+    k = min(k, scores.shape[0])
+    ids = xp.argpartition(-scores, k - 1)[:k]
+    return ids[xp.argsort(-scores[ids])]
+
+
 class E2E(ChainerASRInterface):
     """E2E module.
 
@@ -345,6 +361,21 @@ class E2E(ChainerASRInterface):
         """Calculate Attentions."""
         self.decoder(ys_pad, xs, x_mask)
 
+    def finalize_for_inference(self, dtype="float32"):
+        """Fold the embedding scale of the decoder into its embedding matrix.
+
+        This is for decoding only and must not be called before training.
+
+        Args:
+            dtype (str): Float precision of the decoder. The encoder, the CTC
+                and the accumulated scores are kept in float32.
+
+        """
+        self.decoder.fold_embedding_scale()
+        if dtype != "float32":
+            for param in self.decoder.params():
+                param.array = param.array.astype(dtype)
+
     def recognize(self, x_block, recog_args, char_list=None, rnnlm=None):
         """E2E recognition function.
 
@@ -415,10 +446,15 @@ class E2E(ChainerASRInterface):
         logging.info("min output length: " + str(minlen))
 
         # initialize hypothesis
+        # yseq is a buffer large enough for maxlen outputs and the final <eos>,
+        # so that expanding a hypothesis is a single copy; only the first
+        # `length` ids are valid.
+        yseq = np.full(maxlen + 2, self.eos, dtype=np.int64)
+        yseq[0] = y
         if rnnlm:
-            hyp = {"score": 0.0, "yseq": [y], "rnnlm_prev": None}
+            hyp = {"score": 0.0, "yseq": yseq, "length": 1, "rnnlm_prev": None}
         else:
-            hyp = {"score": 0.0, "yseq": [y]}
+            hyp = {"score": 0.0, "yseq": yseq, "length": 1}
 
         if lpz is not None:
             ctc_prefix_score = CTCPrefixScore(lpz, 0, self.eos, self.xp)
@@ -432,61 +468,118 @@ class E2E(ChainerASRInterface):
 
         hyps = [hyp]
         ended_hyps = []
+        # the source attention keys and values and the mask of the encoder
+        # memory are the same for every step, so they are computed once and
+        # only broadcast again when the number of hypotheses changes
+        source_kv = self.decoder.precompute_source_kv(
+            F.cast(h, self.decoder.embed.W.dtype)
+        )
+        n_hyps = 0
 
-        for i in six.moves.range(maxlen):
+        for i in range(maxlen):
             logging.debug("position " + str(i))
 
-            hyps_best_kept = []
-            for hyp in hyps:
-                ys = F.expand_dims(xp.array(hyp["yseq"]), axis=0).data
-                out = self.decoder(ys, h, h_mask)
-
-                # get nbest local scores and their ids
-                local_att_scores = F.log_softmax(out[:, -1], axis=-1).data
-                if rnnlm:
-                    rnnlm_state, local_lm_scores = rnnlm.predict(
-                        hyp["rnnlm_prev"], hyp["yseq"][i]
+            # all the surviving hypotheses share the same length, so they are
+            # decoded together in a single decoder call
+            if n_hyps != len(hyps):
+                n_hyps = len(hyps)
+                batch_source_kv = [
+                    (
+                        F.broadcast_to(K, (n_hyps,) + K.shape[1:]),
+                        F.broadcast_to(V, (n_hyps,) + V.shape[1:]),
                     )
-                    local_scores = (
-                        local_att_scores + recog_args.lm_weight * local_lm_scores
+                    for K, V in source_kv
+                ]
+                source_mask = xp.broadcast_to(h_mask, (n_hyps, n_len))
+            ys = np.array([hyp["yseq"][: i + 1] for hyp in hyps])
+            if "dec_cache" not in hyps[0]:
+                cache = None
+            elif n_hyps == 1:
+                # a single hypothesis (e.g. greedy search) needs no merging
+                cache = hyps[0]["dec_cache"]
+            else:
+                # merge the self-attention caches of the hypotheses into a batch
+                cache = [
+                    (
+                        F.concat([hyp["dec_cache"][n][0] for hyp in hyps], axis=0),
+                        F.concat([hyp["dec_cache"][n][1] for hyp in hyps], axis=0),
                     )
+                    for n in range(self.decoder.n_layers)
+                ]
+            out, cache = self.decoder.forward_one_step(
+                ys, None, source_mask, cache=cache, source_kv=batch_source_kv
+            )
+            logits = F.cast(out[:, -1], np.float32)
+
+            if lpz is None and rnnlm is None:
+                # log_softmax keeps the order of the logits, so the best ids are
+                # taken from the logits and only their scores are normalized
+                scores = logits.data
+                log_norm = F.logsumexp(logits, axis=-1).data
+            else:
+                att_scores = F.log_softmax(logits, axis=-1).data
+                if rnnlm:
+                    rnnlm_states, lm_scores = [], []
+                    for hyp in hyps:
+                        rnnlm_state, local_lm_scores = rnnlm.predict(
+                            hyp["rnnlm_prev"], hyp["yseq"][i]
+                        )
+                        rnnlm_states.append(rnnlm_state)
+                        lm_scores.append(local_lm_scores)
+                    lm_scores = xp.concatenate(lm_scores, axis=0)
+                    scores = att_scores + recog_args.lm_weight * lm_scores
                 else:
-                    local_scores = local_att_scores
+                    scores = att_scores
+
+            if lpz is not None:
+                # pre-prune the labels of each hypothesis and score the
+                # prefixes of the whole beam with CTC at once
+                ctc_ids = xp.stack([topk_ids(xp, x, ctc_beam) for x in scores])
+                ctc_scores, ctc_states = ctc_prefix_score.batch_score(
+                    ys, ctc_ids, xp.stack([hyp["ctc_state_prev"] for hyp in hyps])
+                )
 
+            hyps_best_kept = []
+            for k, hyp in enumerate(hyps):
+                dec_cache = [(K[k : k + 1], V[k : k + 1]) for K, V in cache]
+                # get nbest local scores and their ids
                 if lpz is not None:
-                    local_best_ids = xp.argsort(local_scores, axis=1)[0, ::-1][
-                        :ctc_beam
-                    ]
-                    ctc_scores, ctc_states = ctc_prefix_score(
-                        hyp["yseq"], local_best_ids, hyp["ctc_state_prev"]
-                    )
-                    local_scores = (1.0 - ctc_weight) * local_att_scores[
-                        :, local_best_ids
-                    ] + ctc_weight * (ctc_scores - hyp["ctc_score_prev"])
+                    local_best_ids = ctc_ids[k]
+                    local_scores = (1.0 - ctc_weight) * att_scores[
+                        k, local_best_ids
+                    ] + ctc_weight * (ctc_scores[k] - hyp["ctc_score_prev"])
                     if rnnlm:
                         local_scores += (
-                            recog_args.lm_weight * local_lm_scores[:, local_best_ids]
+                            recog_args.lm_weight * lm_scores[k, local_best_ids]
                         )
-                    joint_best_ids = xp.argsort(local_scores, axis=1)[0, ::-1][:beam]
-                    local_best_scores = local_scores[:, joint_best_ids]
+                    joint_best_ids = topk_ids(xp, local_scores, beam)
+                    local_best_scores = local_scores[joint_best_ids]
                     local_best_ids = local_best_ids[joint_best_ids]
+                    joint_best_ids = chainer.backends.cuda.to_cpu(joint_best_ids)
                 else:
-                    local_best_ids = self.xp.argsort(local_scores, axis=1)[0, ::-1][
-                        :beam
-                    ]
-                    local_best_scores = local_scores[:, local_best_ids]
-
-                for j in six.moves.range(beam):
+                    local_best_ids = topk_ids(xp, scores[k], beam)
+                    local_best_scores = scores[k, local_best_ids]
+                    if rnnlm is None:
+                        local_best_scores -= log_norm[k]
+
+                # transfer the selected scores and ids to the host at once
+                local_best_scores = chainer.backends.cuda.to_cpu(
+                    local_best_scores
+                ).tolist()
+                local_best_ids = chainer.backends.cuda.to_cpu(local_best_ids).tolist()
+
+                for j in range(beam):
                     new_hyp = {}
-                    new_hyp["score"] = hyp["score"] + float(local_best_scores[0, j])
-                    new_hyp["yseq"] = [0] * (1 + len(hyp["yseq"]))
-                    new_hyp["yseq"][: len(hyp["yseq"])] = hyp["yseq"]
-                    new_hyp["yseq"][len(hyp["yseq"])] = int(local_best_ids[j])
+                    new_hyp["score"] = hyp["score"] + local_best_scores[j]
+                    new_hyp["yseq"] = hyp["yseq"].copy()
+                    new_hyp["yseq"][i + 1] = local_best_ids[j]
+                    new_hyp["length"] = i + 2
+                    new_hyp["dec_cache"] = dec_cache
                     if rnnlm:
-                        new_hyp["rnnlm_prev"] = rnnlm_state
+                        new_hyp["rnnlm_prev"] = rnnlm_states[k]
                     if lpz is not None:
-                        new_hyp["ctc_state_prev"] = ctc_states[joint_best_ids[j]]
-                        new_hyp["ctc_score_prev"] = ctc_scores[joint_best_ids[j]]
+                        new_hyp["ctc_state_prev"] = ctc_states[k, joint_best_ids[j]]
+                        new_hyp["ctc_score_prev"] = ctc_scores[k, joint_best_ids[j]]
                     hyps_best_kept.append(new_hyp)
 
                 hyps_best_kept = sorted(
@@ -499,7 +592,12 @@ class E2E(ChainerASRInterface):
             if char_list is not None:
                 logging.debug(
                     "best hypo: "
-                    + "".join([char_list[int(x)] for x in hyps[0]["yseq"][1:]])
+                    + "".join(
+                        [
+                            char_list[int(x)]
+                            for x in hyps[0]["yseq"][1 : hyps[0]["length"]]
+                        ]
+                    )
                     + " score: "
                     + str(hyps[0]["score"])
                 )
@@ -508,15 +606,18 @@ class E2E(ChainerASRInterface):
             if i == maxlen - 1:
                 logging.info("adding <eos> in the last position in the loop")
                 for hyp in hyps:
-                    hyp["yseq"].append(self.eos)
+                    hyp["yseq"][hyp["length"]] = self.eos
+                    hyp["length"] += 1
 
             # add ended hypothes to a final list, and removed them from current hypothes
             # (this will be a probmlem, number of hyps < beam)
             remained_hyps = []
             for hyp in hyps:
-                if hyp["yseq"][-1] == self.eos:
+                if hyp["yseq"][hyp["length"] - 1] == self.eos:
                     # only store the sequence that has more than minlen outputs
                     # also add penalty
+                    del hyp["dec_cache"]
+                    hyp["yseq"] = hyp["yseq"][: hyp.pop("length")].tolist()
                     if len(hyp["yseq"]) > minlen:
                         hyp["score"] += (i + 1) * penalty
                         if rnnlm:  # Word LM needs to add final <eos> score
@@ -541,7 +642,10 @@ class E2E(ChainerASRInterface):
             if char_list is not None:
                 for hyp in hyps:
                     logging.debug(
-                        "hypo: " + "".join([char_list[int(x)] for x in hyp["yseq"][1:]])
+                        "hypo: "
+                        + "".join(
+                            [char_list[int(x)] for x in hyp["yseq"][1 : hyp["length"]]]
+                        )
                     )
 
             logging.debug("number of ended hypothes: " + str(len(ended_hyps)))
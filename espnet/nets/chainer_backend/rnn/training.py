@@ -5,7 +5,6 @@
 import collections
 import logging
 import math
-import six
 
 # chainer related
 from chainer import cuda
@@ -37,7 +36,7 @@ def sum_sqnorm(arr):
                 x = x.ravel()
                 s = x.dot(x)
                 sq_sum[int(dev)] += s
-    return sum([float(i) for i in six.itervalues(sq_sum)])
+    return sum([float(i) for i in sq_sum.values()])
 
 
 class CustomUpdater(training.StandardUpdater):
@@ -8,8 +8,6 @@ import chainer.links as L
 
 import numpy as np
 
-MIN_VALUE = float(np.finfo(np.float32).min)
-
 
 class MultiHeadAttention(chainer.Chain):
     """Multi Head Attention Layer.
@@ -62,7 +60,7 @@ class MultiHeadAttention(chainer.Chain):
         self.dropout = dropout
         self.attn = None
 
-    def forward(self, e_var, s_var=None, mask=None, batch=1):
+    def forward(self, e_var, s_var=None, mask=None, batch=1, kv=None):
         """Core function of the Multi-head attention layer.
 
         Args:
@@ -70,13 +68,17 @@ class MultiHeadAttention(chainer.Chain):
             s_var (chainer.Variable): Variable of source array from encoder.
             mask (chainer.Variable): Attention mask.
             batch (int): Batch size.
+            kv (tuple): Keys and values of the source array computed by
+                `project_kv`, used instead of `s_var`.
 
         Returns:
             chainer.Variable: Outout of multi-head attention layer.
 
         """
-        xp = self.xp
-        if s_var is None:
+        if kv is not None:
+            Q = self.linear_q(e_var).reshape(batch, -1, self.h, self.d_k)
+            K, V = kv
+        elif s_var is None:
             # batch, head, time1/2, d_k)
             Q = self.linear_q(e_var).reshape(batch, -1, self.h, self.d_k)
             K = self.linear_k(e_var).reshape(batch, -1, self.h, self.d_k)
@@ -85,12 +87,70 @@ class MultiHeadAttention(chainer.Chain):
             Q = self.linear_q(e_var).reshape(batch, -1, self.h, self.d_k)
             K = self.linear_k(s_var).reshape(batch, -1, self.h, self.d_k)
             V = self.linear_v(s_var).reshape(batch, -1, self.h, self.d_k)
+        return self.attend(Q, K, V, mask)
+
+    def project_kv(self, s_var, batch=1):
+        """Compute the keys and values of a source array.
+
+        Args:
+            s_var (chainer.Variable): Variable of source array. (B * T, D)
+            batch (int): Batch size.
+
+        Returns:
+            tuple: Keys and values, each with dimensions (B, T, H, d_k).
+
+        """
+        K = self.linear_k(s_var).reshape(batch, -1, self.h, self.d_k)
+        V = self.linear_v(s_var).reshape(batch, -1, self.h, self.d_k)
+        return K, V
+
+    def forward_one_step(self, e_var, mask=None, batch=1, cache=None):
+        """Compute self-attention of new frames over cached keys and values.
+
+        Args:
+            e_var (chainer.Variable): Variable of new input frames. (B * Lnew, D)
+            mask (ndarray): Attention mask. (B, Lnew, Lprev + Lnew)
+            batch (int): Batch size.
+            cache (tuple): Keys and values of the previous frames, each with
+                dimensions (B, Lprev, H, d_k).
+
+        Returns:
+            chainer.Variable: Outout of multi-head attention layer.
+            tuple: Keys and values of all the frames, each with dimensions
+                (B, Lprev + Lnew, H, d_k).
+
+        """
+        Q = self.linear_q(e_var).reshape(batch, -1, self.h, self.d_k)
+        K = self.linear_k(e_var).reshape(batch, -1, self.h, self.d_k)
+        V = self.linear_v(e_var).reshape(batch, -1, self.h, self.d_k)
+        if cache is not None:
+            K = F.concat([cache[0], K], axis=1)
+            V = F.concat([cache[1], V], axis=1)
+        return self.attend(Q, K, V, mask), (K, V)
+
+    def attend(self, Q, K, V, mask=None):
+        """Compute the scaled dot-product attention over all the heads.
+
+        Args:
+            Q (chainer.Variable): Queries. (B, Lq, H, d_k)
+            K (chainer.Variable): Keys. (B, Lk, H, d_k)
+            V (chainer.Variable): Values. (B, Lk, H, d_k)
+            mask (ndarray): Attention mask. (B, Lq, Lk)
+
+        Returns:
+            chainer.Variable: Outout of multi-head attention layer.
+
+        """
+        xp = self.xp
         scores = F.matmul(F.swapaxes(Q, 1, 2), K.transpose(0, 2, 3, 1)) / np.sqrt(
             self.d_k
         )
         if mask is not None:
             mask = xp.stack([mask] * self.h, axis=1)
-            scores = F.where(mask, scores, xp.full(scores.shape, MIN_VALUE, "f"))
+            min_value = float(np.finfo(scores.dtype).min)
+            scores = F.where(
+                mask, scores, xp.full(scores.shape, min_value, scores.dtype)
+            )
         self.attn = F.softmax(scores, axis=-1)
         p_attn = F.dropout(self.attn, self.dropout)
         x = F.matmul(p_attn, F.swapaxes(V, 1, 2))
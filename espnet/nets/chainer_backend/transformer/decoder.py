@@ -9,7 +9,6 @@ import chainer.links as L
 from espnet.nets.chainer_backend.transformer.decoder_layer import DecoderLayer
 from espnet.nets.chainer_backend.transformer.embedding import PositionalEncoding
 from espnet.nets.chainer_backend.transformer.layer_norm import LayerNorm
-from espnet.nets.chainer_backend.transformer.mask import make_history_mask
 
 import numpy as np
 
@@ -66,6 +65,7 @@ class Decoder(chainer.Chain):
             )
             self.add_link(name, layer)
         self.n_layers = args.dlayers
+        self._history_mask = None
 
     def make_attention_mask(self, source_block, target_block):
         """Prepare the attention mask.
@@ -81,6 +81,38 @@ class Decoder(chainer.Chain):
         # (batch, source_length, target_length)
         return mask
 
+    def make_history_mask(self, block):
+        """Prepare the history mask from a cached lower triangular matrix.
+
+        Args:
+            block (ndarray): Block with dimensions: (B x S).
+        Returns:
+            ndarray: History mask with dimensions (B, S, S).
+
+        """
+        xp = self.xp
+        batch, length = block.shape
+        cache = self._history_mask
+        if (
+            cache is None
+            or not isinstance(cache, xp.ndarray)
+            or cache.shape[0] < length
+        ):
+            size = length if cache is None else max(length, 2 * cache.shape[0])
+            cache = xp.tri(size, dtype=np.bool_)
+            self._history_mask = cache
+        return xp.broadcast_to(cache[None, :length, :length], (batch, length, length))
+
+    def fold_embedding_scale(self):
+        """Fold the input scale of the positional encoding into the embedding.
+
+        The scaled embedding matrix is only valid for inference, since training
+        expects the embedding and its scale to be separate.
+
+        """
+        self.embed.W.array *= self.pe.scale
+        self.pe.scale = 1.0
+
     def forward(self, ys_pad, source, x_mask):
         """Forward decoder.
 
@@ -99,7 +131,7 @@ class Decoder(chainer.Chain):
         # mask preparation
         xy_mask = self.make_attention_mask(e, xp.array(x_mask))
         yy_mask = self.make_attention_mask(e, e)
-        yy_mask *= make_history_mask(xp, e)
+        yy_mask *= self.make_history_mask(e)
 
         e = self.pe(self.embed(e))
         batch, length, dims = e.shape
@@ -109,6 +141,77 @@ class Decoder(chainer.Chain):
             e = self["decoders." + str(i)](e, source, xy_mask, yy_mask, batch)
         return self.output_layer(self.output_norm(e)).reshape(batch, length, -1)
 
+    def precompute_source_kv(self, source):
+        """Compute the source attention keys and values of each layer.
+
+        They only depend on the encoded memory, so they can be computed once
+        per utterance and reused at every decoding step.
+
+        Args:
+            source (chainer.Variable): Encoded memory. (B, Tmax, D)
+
+        Returns:
+            List[tuple]: Keys and values of each layer, each with dimensions
+                (B, Tmax, H, d_k).
+
+        """
+        batch, _, dims = source.shape
+        source = source.reshape(-1, dims)
+        return [
+            self["decoders." + str(i)].src_attn.project_kv(source, batch=batch)
+            for i in range(self.n_layers)
+        ]
+
+    def forward_one_step(self, ys_pad, source, x_mask, cache=None, source_kv=None):
+        """Forward decoder only for the frames not covered by the cache.
+
+        Args:
+            ys_pad (ndarray): Input token ids without <sos>. (B, Lmax)
+            source (chainer.Variable): Encoded memory. (B, Tmax, D)
+            x_mask (ndarray): Encoded memory mask. (B, Tmax)
+            cache (List[tuple]): Self-attention keys and values of each layer
+                for the previous frames, each with dimensions (B, Lprev, H, d_k).
+            source_kv (List[tuple]): Source attention keys and values of each
+                layer from `precompute_source_kv`. If given, `source` is not used.
+
+        Returns:
+            chainer.Variable: Decoded token score before softmax of the new frames.
+                (B, Lmax + 1 - Lprev, odim)
+            List[tuple]: Self-attention keys and values of each layer.
+
+        """
+        xp = self.xp
+        sos = np.full((len(ys_pad), 1), self.sos, dtype=np.int32)
+        e = xp.array(np.concatenate([sos, ys_pad], axis=1))
+        offset = 0 if cache is None else cache[0][0].shape[1]
+        # mask preparation for the new frames
+        xy_mask = self.make_attention_mask(e[:, offset:], xp.asarray(x_mask))
+        yy_mask = self.make_attention_mask(e[:, offset:], e)
+        yy_mask *= self.make_history_mask(e)[:, offset:]
+
+        e = self.pe(self.embed(e[:, offset:]), offset=offset)
+        batch, length, dims = e.shape
+        e = e.reshape(-1, dims)
+        if source_kv is None:
+            source = source.reshape(-1, dims)
+            source_kv = [None] * self.n_layers
+        if cache is None:
+            cache = [None] * self.n_layers
+        new_cache = []
+        for i in range(self.n_layers):
+            e, c = self["decoders." + str(i)].forward_one_step(
+                e,
+                source,
+                xy_mask,
+                yy_mask,
+                batch,
+                cache=cache[i],
+                source_kv=source_kv[i],
+            )
+            new_cache.append(c)
+        e = self.output_layer(self.output_norm(e)).reshape(batch, length, -1)
+        return e, new_cache
+
     def recognize(self, e, yy_mask, source):
         """Process recognition function."""
         e = self.forward(e, source, yy_mask)
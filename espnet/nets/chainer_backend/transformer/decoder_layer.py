@@ -78,3 +78,38 @@ class DecoderLayer(chainer.Chain):
         n_e = self.feed_forward(n_e)
         e = e + F.dropout(n_e, self.dropout)
         return e
+
+    def forward_one_step(
+        self, e, s, xy_mask, yy_mask, batch, cache=None, source_kv=None
+    ):
+        """Compute decoder layer for new frames only.
+
+        Args:
+            e (chainer.Variable): Batch of new frames. (B * Lnew, D)
+            s (chainer.Variable): Batch of encoded memory. (B * Tmax, D)
+            xy_mask (ndarray): Source mask. (B, Lnew, Tmax)
+            yy_mask (ndarray): Target mask. (B, Lnew, Lprev + Lnew)
+            batch (int): Batch size.
+            cache (tuple): Self-attention keys and values of the previous frames.
+            source_kv (tuple): Source attention keys and values of the encoded
+                memory, used instead of `s`.
+
+        Returns:
+            chainer.Variable: Computed variable of decoder. (B * Lnew, D)
+            tuple: Self-attention keys and values of all the frames.
+
+        """
+        n_e = self.norm1(e)
+        n_e, cache = self.self_attn.forward_one_step(
+            n_e, mask=yy_mask, batch=batch, cache=cache
+        )
+        e = e + F.dropout(n_e, self.dropout)
+
+        n_e = self.norm2(e)
+        n_e = self.src_attn(n_e, s_var=s, mask=xy_mask, batch=batch, kv=source_kv)
+        e = e + F.dropout(n_e, self.dropout)
+
+        n_e = self.norm3(e)
+        n_e = self.feed_forward(n_e)
+        e = e + F.dropout(n_e, self.dropout)
+        return e, cache
@@ -30,8 +30,16 @@ class PositionalEncoding(chainer.Chain):
         self.pe[:, 1::2] = np.cos(posi_block * unit_block)
         self.scale = np.sqrt(n_units)
 
-    def forward(self, e):
-        """Forward Positional Encoding."""
+    def forward(self, e, offset=0):
+        """Forward Positional Encoding.
+
+        Args:
+            e (chainer.Variable): Batch of embedded frames. (B, L, D)
+            offset (int): Position of the first frame.
+
+        """
         length = e.shape[1]
-        e = e * self.scale + self.xp.array(self.pe[:length])
+        if self.scale != 1.0:
+            e = e * self.scale
+        e = e + self.xp.array(self.pe[offset : offset + length], dtype=e.dtype)
         return F.dropout(e, self.dropout)
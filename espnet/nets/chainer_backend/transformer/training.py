@@ -4,7 +4,6 @@
 import collections
 import logging
 import math
-import six
 
 from chainer import cuda
 from chainer import functions as F
@@ -34,7 +33,7 @@ def sum_sqnorm(arr):
                 x = x.ravel()
                 s = x.dot(x)
                 sq_sum[int(dev)] += s
-    return sum([float(i) for i in six.itervalues(sq_sum)])
+    return sum([float(i) for i in sq_sum.values()])
 
 
 class CustomUpdater(training.StandardUpdater):
@@ -357,3 +357,56 @@ class CTCPrefixScore(object):
         # return the log prefix probability and CTC states, where the label axis
         # of the CTC states is moved to the first axis to slice it easily
         return log_psi, self.xp.rollaxis(r, 2)
+
+    def batch_score(self, ys, cs, r_prev):
+        """Compute CTC prefix scores for next labels of a batch of prefixes
+
+        All the prefixes must have the same length, e.g. the hypotheses of
+        a beam at one output step.
+
+        :param ys    : prefix label sequences (B, L)
+        :param cs    : arrays of next labels (B, C)
+        :param r_prev: previous CTC states (B, T, 2)
+        :return ctc_scores (B, C), ctc_states (B, C, T, 2)
+        """
+        xp = self.xp
+        # initialize CTC states
+        output_length = ys.shape[1] - 1  # ignore sos
+        # new CTC states are prepared as a frame x (n or b) x batch x n_labels
+        # tensor that corresponds to r_t^n(h) and r_t^b(h).
+        r = xp.ndarray((self.input_length, 2) + cs.shape, dtype=np.float32)
+        xs = self.x[:, cs]
+        if output_length == 0:
+            r[0, 0] = xs[0]
+            r[0, 1] = self.logzero
+        else:
+            r[output_length - 1] = self.logzero
+
+        # prepare forward probabilities for the last label
+        r_prev = r_prev.transpose(1, 2, 0)  # (T, 2, B)
+        r_sum = xp.logaddexp(r_prev[:, 0], r_prev[:, 1])  # log(r_t^n(g) + r_t^b(g))
+        if output_length > 0:
+            last = xp.asarray(ys[:, -1])
+            log_phi = xp.where(
+                cs == last[:, None], r_prev[:, 1, :, None], r_sum[:, :, None]
+            )
+        else:
+            log_phi = xp.broadcast_to(r_sum[:, :, None], xs.shape)
+
+        # compute forward probabilities log(r_t^n(h)), log(r_t^b(h)),
+        # and log prefix probabilities log(psi)
+        start = max(output_length, 1)
+        log_psi = r[start - 1, 0]
+        for t in range(start, self.input_length):
+            r[t, 0] = xp.logaddexp(r[t - 1, 0], log_phi[t - 1]) + xs[t]
+            r[t, 1] = xp.logaddexp(r[t - 1, 0], r[t - 1, 1]) + self.x[t, self.blank]
+            log_psi = xp.logaddexp(log_psi, log_phi[t - 1] + xs[t])
+
+        # get P(...eos|X) that ends with the prefix itself
+        log_psi = xp.where(cs == self.eos, r_sum[-1, :, None], log_psi)
+        # exclude blank probs
+        log_psi = xp.where(cs == self.blank, self.logzero, log_psi)
+
+        # return the log prefix probabilities and CTC states, where the batch
+        # and label axes of the CTC states are moved to the first axes
+        return log_psi, r.transpose(2, 3, 0, 1)
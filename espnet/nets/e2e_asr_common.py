@@ -11,10 +11,17 @@ import logging
 import sys
 
 import editdistance
-from itertools import groupby
 import numpy as np
 import six
 
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    edit_distance = editdistance.eval
+else:
+    # releases the GIL and is faster than editdistance for the same results
+    edit_distance = Levenshtein.distance
+
 
 def end_detect(ended_hyps, i, M=3, D_end=np.log(1 * np.exp(-10))):
     """End detection.
@@ -126,6 +133,22 @@ class ErrorCalculator(object):
             self.idx_space = self.char_list.index(self.space)
         else:
             self.idx_space = None
+        # used to map a whole id sequence to characters with fancy indexing
+        self.char_array = np.array(self.char_list, dtype=object)
+        self.ignore_ids = np.array(
+            [-1, self.idx_blank]
+            + ([self.idx_space] if self.idx_space is not None else [])
+        )
+
+    def ids_to_chars(self, ids):
+        """Convert an id sequence to characters without padding, blank and space.
+
+        :param np.ndarray ids: token id sequence (seqlen,)
+        :return: concatenated characters
+        :rtype str
+        """
+        ids = ids[~np.isin(ids, self.ignore_ids)]
+        return "".join(self.char_array[ids])
 
     def __call__(self, ys_hat, ys_pad, is_ctc=False):
         """Calculate sentence-level WER/CER score.
@@ -162,23 +185,14 @@ class ErrorCalculator(object):
         """
         cers, char_ref_lens = [], []
         for i, y in enumerate(ys_hat):
-            y_hat = [x[0] for x in groupby(y)]
-            y_true = ys_pad[i]
-            seq_hat, seq_true = [], []
-            for idx in y_hat:
-                idx = int(idx)
-                if idx != -1 and idx != self.idx_blank and idx != self.idx_space:
-                    seq_hat.append(self.char_list[int(idx)])
-
-            for idx in y_true:
-                idx = int(idx)
-                if idx != -1 and idx != self.idx_blank and idx != self.idx_space:
-                    seq_true.append(self.char_list[int(idx)])
-
-            hyp_chars = "".join(seq_hat)
-            ref_chars = "".join(seq_true)
+            y_hat = np.asarray(y)
+            if len(y_hat) > 0:
+                # collapse repeated labels
+                y_hat = y_hat[np.concatenate(([True], y_hat[1:] != y_hat[:-1]))]
+            hyp_chars = self.ids_to_chars(y_hat)
+            ref_chars = self.ids_to_chars(np.asarray(ys_pad[i]))
             if len(ref_chars) > 0:
-                cers.append(editdistance.eval(hyp_chars, ref_chars))
+                cers.append(edit_distance(hyp_chars, ref_chars))
                 char_ref_lens.append(len(ref_chars))
 
         cer_ctc = float(sum(cers)) / sum(char_ref_lens) if cers else None
@@ -222,7 +236,7 @@ class ErrorCalculator(object):
             seq_true_text = seqs_true[i]
             hyp_chars = seq_hat_text.replace(" ", "")
             ref_chars = seq_true_text.replace(" ", "")
-            char_eds.append(editdistance.eval(hyp_chars, ref_chars))
+            char_eds.append(edit_distance(hyp_chars, ref_chars))
             char_ref_lens.append(len(ref_chars))
         return float(sum(char_eds)) / sum(char_ref_lens)
 
@@ -239,6 +253,6 @@ class ErrorCalculator(object):
             seq_true_text = seqs_true[i]
             hyp_words = seq_hat_text.split()
             ref_words = seq_true_text.split()
-            word_eds.append(editdistance.eval(hyp_words, ref_words))
+            word_eds.append(edit_distance(hyp_words, ref_words))
             word_ref_lens.append(len(ref_words))
         return float(sum(word_eds)) / sum(word_ref_lens)
@@ -9,17 +9,41 @@ import torch.nn.functional as F
 from espnet.nets.pytorch_backend.nets_utils import to_device
 
 
+@torch.jit.script
+def linear_log_softmax(
+    x: torch.Tensor, weight: torch.Tensor, bias: torch.Tensor
+) -> torch.Tensor:
+    """Apply a linear projection followed by log_softmax in one scripted graph."""
+    return torch.log_softmax(F.linear(x, weight, bias), dim=-1)
+
+
+@torch.jit.script
+def linear_softmax(
+    x: torch.Tensor, weight: torch.Tensor, bias: torch.Tensor
+) -> torch.Tensor:
+    """Apply a linear projection followed by softmax in one scripted graph."""
+    return torch.softmax(F.linear(x, weight, bias), dim=-1)
+
+
+@torch.jit.script
+def linear_argmax(
+    x: torch.Tensor, weight: torch.Tensor, bias: torch.Tensor
+) -> torch.Tensor:
+    """Apply a linear projection followed by argmax in one scripted graph."""
+    return torch.argmax(F.linear(x, weight, bias), dim=-1)
+
+
 class CTC(torch.nn.Module):
     """CTC module
 
     :param int odim: dimension of outputs
     :param int eprojs: number of encoder projection units
     :param float dropout_rate: dropout rate (0.0 ~ 1.0)
-    :param str ctc_type: builtin or warpctc
+    :param str ctc_type: builtin, cudnnctc, warpctc or gtnctc
     :param bool reduce: reduce the CTC loss into a scalar
     """
 
-    def __init__(self, odim, eprojs, dropout_rate, ctc_type="warpctc", reduce=True):
+    def __init__(self, odim, eprojs, dropout_rate, ctc_type="builtin", reduce=True):
         super().__init__()
         self.dropout_rate = dropout_rate
         self.loss = None
@@ -90,8 +114,10 @@ class CTC(torch.nn.Module):
         :return: ctc loss value
         :rtype: torch.Tensor
         """
-        # TODO(kan-bayashi): need to make more smart way
-        ys = [y[y != self.ignore_id] for y in ys_pad]  # parse padded ys
+        # parse padded ys into the concatenated targets and their lengths
+        ys_mask = ys_pad != self.ignore_id
+        ys_true = ys_pad[ys_mask]
+        olens = ys_mask.sum(1)
 
         # zero padding for hs
         ys_hat = self.ctc_lo(self.dropout(hs_pad))
@@ -99,18 +125,16 @@ class CTC(torch.nn.Module):
             ys_hat = ys_hat.transpose(0, 1)
 
         if self.ctc_type == "builtin":
-            olens = to_device(ys_hat, torch.LongTensor([len(s) for s in ys]))
             hlens = hlens.long()
-            ys_pad = torch.cat(ys)  # without this the code breaks for asr_mix
-            self.loss = self.loss_fn(ys_hat, ys_pad, hlens, olens)
+            self.loss = self.loss_fn(ys_hat, ys_true, hlens, olens)
         else:
             self.loss = None
-            hlens = torch.from_numpy(np.fromiter(hlens, dtype=np.int32))
-            olens = torch.from_numpy(
-                np.fromiter((x.size(0) for x in ys), dtype=np.int32)
-            )
-            # zero padding for ys
-            ys_true = torch.cat(ys).cpu().int()  # batch x olen
+            hlens = torch.as_tensor(hlens).to(device="cpu", dtype=torch.int32)
+            olens = olens.to(device="cpu", dtype=torch.int32)
+            ys_true = ys_true.int()  # batch x olen
+            if self.ctc_type == "warpctc":
+                # warpctc expects the targets on cpu
+                ys_true = ys_true.cpu()
             # get ctc loss
             # expected shape of seqLength x batchSize x alphabet_size
             dtype = ys_hat.dtype
@@ -123,7 +147,7 @@ class CTC(torch.nn.Module):
                 ys_true = to_device(hs_pad, ys_true)
             if self.ctc_type == "gtnctc":
                 # keep as list for gtn
-                ys_true = ys
+                ys_true = [y[m] for y, m in zip(ys_pad, ys_mask)]
             self.loss = to_device(
                 hs_pad, self.loss_fn(ys_hat, ys_true, hlens, olens)
             ).to(dtype=dtype)
@@ -156,7 +180,10 @@ class CTC(torch.nn.Module):
         :return: log softmax applied 3d tensor (B, Tmax, odim)
         :rtype: torch.Tensor
         """
-        self.probs = F.softmax(self.ctc_lo(hs_pad), dim=2)
+        if not isinstance(self.ctc_lo, torch.nn.Linear):
+            self.probs = F.softmax(self.ctc_lo(hs_pad), dim=2)
+        else:
+            self.probs = linear_softmax(hs_pad, self.ctc_lo.weight, self.ctc_lo.bias)
         return self.probs
 
     def log_softmax(self, hs_pad):
@@ -166,7 +193,10 @@ class CTC(torch.nn.Module):
         :return: log softmax applied 3d tensor (B, Tmax, odim)
         :rtype: torch.Tensor
         """
-        return F.log_softmax(self.ctc_lo(hs_pad), dim=2)
+        if not isinstance(self.ctc_lo, torch.nn.Linear):
+            # e.g. dynamically quantized linear layer
+            return F.log_softmax(self.ctc_lo(hs_pad), dim=2)
+        return linear_log_softmax(hs_pad, self.ctc_lo.weight, self.ctc_lo.bias)
 
     def argmax(self, hs_pad):
         """argmax of frame activations
@@ -175,7 +205,9 @@ class CTC(torch.nn.Module):
         :return: argmax applied 2d tensor (B, Tmax)
         :rtype: torch.Tensor
         """
-        return torch.argmax(self.ctc_lo(hs_pad), dim=2)
+        if not isinstance(self.ctc_lo, torch.nn.Linear):
+            return torch.argmax(self.ctc_lo(hs_pad), dim=2)
+        return linear_argmax(hs_pad, self.ctc_lo.weight, self.ctc_lo.bias)
 
     def forced_align(self, h, y, blank_id=0):
         """forced alignment.
@@ -11,12 +11,12 @@ import os
 
 import chainer
 from chainer import reporter
-import editdistance
 import numpy as np
 import six
 import torch
 
 from espnet.nets.asr_interface import ASRInterface
+from espnet.nets.e2e_asr_common import edit_distance
 from espnet.nets.e2e_asr_common import label_smoothing_dist
 from espnet.nets.pytorch_backend.ctc import ctc_for
 from espnet.nets.pytorch_backend.frontends.feature_transform import (
@@ -263,9 +263,7 @@ class E2E(ASRInterface, torch.nn.Module):
                 hyp_chars = seq_hat_text.replace(" ", "")
                 ref_chars = seq_true_text.replace(" ", "")
                 if len(ref_chars) > 0:
-                    cers.append(
-                        editdistance.eval(hyp_chars, ref_chars) / len(ref_chars)
-                    )
+                    cers.append(edit_distance(hyp_chars, ref_chars) / len(ref_chars))
 
             cer_ctc = sum(cers) / len(cers) if cers else None
 
@@ -303,11 +301,11 @@ class E2E(ASRInterface, torch.nn.Module):
 
                 hyp_words = seq_hat_text.split()
                 ref_words = seq_true_text.split()
-                word_eds.append(editdistance.eval(hyp_words, ref_words))
+                word_eds.append(edit_distance(hyp_words, ref_words))
                 word_ref_lens.append(len(ref_words))
                 hyp_chars = seq_hat_text.replace(" ", "")
                 ref_chars = seq_true_text.replace(" ", "")
-                char_eds.append(editdistance.eval(hyp_chars, ref_chars))
+                char_eds.append(edit_distance(hyp_chars, ref_chars))
                 char_ref_lens.append(len(ref_chars))
 
             wer = (
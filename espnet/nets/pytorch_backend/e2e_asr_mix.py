@@ -14,12 +14,12 @@ import math
 import os
 import sys
 
-import editdistance
 import numpy as np
 import six
 import torch
 
 from espnet.nets.asr_interface import ASRInterface
+from espnet.nets.e2e_asr_common import edit_distance
 from espnet.nets.e2e_asr_common import get_vgg2l_odim
 from espnet.nets.e2e_asr_common import label_smoothing_dist
 from espnet.nets.pytorch_backend.ctc import ctc_for
@@ -372,7 +372,7 @@ class E2E(ASRInterface, torch.nn.Module):
                     ref_chars = seq_true_text.replace(" ", "")
                     if len(ref_chars) > 0:
                         cers.append(
-                            editdistance.eval(hyp_chars, ref_chars) / len(ref_chars)
+                            edit_distance(hyp_chars, ref_chars) / len(ref_chars)
                         )
 
             cer_ctc = sum(cers) / len(cers) if cers else None
@@ -437,13 +437,13 @@ class E2E(ASRInterface, torch.nn.Module):
                     ref_chars.append(seq_true_text.replace(" ", ""))
 
                 tmp_word_ed = [
-                    editdistance.eval(
+                    edit_distance(
                         hyp_words[ns // self.num_spkrs], ref_words[ns % self.num_spkrs]
                     )
                     for ns in range(self.num_spkrs ** 2)
                 ]  # h1r1,h1r2,h2r1,h2r2
                 tmp_char_ed = [
-                    editdistance.eval(
+                    edit_distance(
                         hyp_chars[ns // self.num_spkrs], ref_chars[ns % self.num_spkrs]
                     )
                     for ns in range(self.num_spkrs ** 2)
@@ -9,7 +9,6 @@ import logging
 import math
 import os
 
-import editdistance
 import nltk
 
 import chainer
@@ -21,6 +20,7 @@ from itertools import groupby
 
 from chainer import reporter
 
+from espnet.nets.e2e_asr_common import edit_distance
 from espnet.nets.e2e_asr_common import label_smoothing_dist
 from espnet.nets.pytorch_backend.ctc import CTC
 from espnet.nets.pytorch_backend.initialization import lecun_normal_init_parameters
@@ -449,11 +449,11 @@ class E2E(STInterface, torch.nn.Module):
 
                     hyp_words = seq_hat_text.split()
                     ref_words = seq_true_text.split()
-                    word_eds.append(editdistance.eval(hyp_words, ref_words))
+                    word_eds.append(edit_distance(hyp_words, ref_words))
                     word_ref_lens.append(len(ref_words))
                     hyp_chars = seq_hat_text.replace(" ", "")
                     ref_chars = seq_true_text.replace(" ", "")
-                    char_eds.append(editdistance.eval(hyp_chars, ref_chars))
+                    char_eds.append(edit_distance(hyp_chars, ref_chars))
                     char_ref_lens.append(len(ref_chars))
 
                 wer = (
@@ -493,7 +493,7 @@ class E2E(STInterface, torch.nn.Module):
                     ref_chars = seq_true_text.replace(" ", "")
                     if len(ref_chars) > 0:
                         cers.append(
-                            editdistance.eval(hyp_chars, ref_chars) / len(ref_chars)
+                            edit_distance(hyp_chars, ref_chars) / len(ref_chars)
                         )
                 cer_ctc = sum(cers) / len(cers) if cers else None
 
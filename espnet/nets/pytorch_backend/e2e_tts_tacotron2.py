@@ -133,9 +133,7 @@ class GuidedAttentionLoss(torch.nn.Module):
             olens (LongTensor or List): Batch of lengths (B,).
 
         Returns:
-            Tensor: Mask tensor indicating non-padded part.
-                    dtype=torch.uint8 in PyTorch 1.2-
-                    dtype=torch.bool in PyTorch 1.2+ (including 1.2)
+            BoolTensor: Mask tensor indicating non-padded part.
 
         Examples:
             >>> ilens, olens = [5, 2], [8, 5]
@@ -214,35 +212,54 @@ class Tacotron2Loss(torch.nn.Module):
         """
         # make mask and apply it
         if self.use_masking:
-            masks = make_non_pad_mask(olens).unsqueeze(-1).to(ys.device)
-            ys = ys.masked_select(masks)
-            after_outs = after_outs.masked_select(masks)
-            before_outs = before_outs.masked_select(masks)
-            labels = labels.masked_select(masks[:, :, 0])
-            logits = logits.masked_select(masks[:, :, 0])
-
-        # calculate loss
-        l1_loss = self.l1_criterion(after_outs, ys) + self.l1_criterion(before_outs, ys)
-        mse_loss = self.mse_criterion(after_outs, ys) + self.mse_criterion(
-            before_outs, ys
-        )
-        bce_loss = self.bce_criterion(logits, labels)
+            # NOTE: The masked mean is calculated as the sum over the valid part
+            # divided by its size instead of gathering it with masked_select
+            masks = make_non_pad_mask(olens, ys[:, :, 0], 1)
+            num_logits = masks.sum()
+            num_outs = num_logits * ys.size(2)
+            masks = masks.unsqueeze(-1).to(ys.dtype)
+            l1_loss = (
+                F.l1_loss(after_outs, ys, reduction="none").mul(masks).sum()
+                + F.l1_loss(before_outs, ys, reduction="none").mul(masks).sum()
+            ) / num_outs
+            mse_loss = (
+                F.mse_loss(after_outs, ys, reduction="none").mul(masks).sum()
+                + F.mse_loss(before_outs, ys, reduction="none").mul(masks).sum()
+            ) / num_outs
+            bce_loss = (
+                F.binary_cross_entropy_with_logits(
+                    logits,
+                    labels,
+                    reduction="none",
+                    pos_weight=self.bce_criterion.pos_weight,
+                )
+                .mul(masks[:, :, 0])
+                .sum()
+                / num_logits
+            )
+        else:
+            # calculate loss
+            l1_loss = self.l1_criterion(after_outs, ys) + self.l1_criterion(
+                before_outs, ys
+            )
+            mse_loss = self.mse_criterion(after_outs, ys) + self.mse_criterion(
+                before_outs, ys
+            )
+            bce_loss = self.bce_criterion(logits, labels)
 
         # make weighted mask and apply it
         if self.use_weighted_masking:
-            masks = make_non_pad_mask(olens).unsqueeze(-1).to(ys.device)
+            masks = make_non_pad_mask(olens, ys[:, :, 0], 1).unsqueeze(-1)
             weights = masks.float() / masks.sum(dim=1, keepdim=True).float()
             out_weights = weights.div(ys.size(0) * ys.size(2))
             logit_weights = weights.div(ys.size(0))
 
             # apply weight
-            l1_loss = l1_loss.mul(out_weights).masked_select(masks).sum()
-            mse_loss = mse_loss.mul(out_weights).masked_select(masks).sum()
-            bce_loss = (
-                bce_loss.mul(logit_weights.squeeze(-1))
-                .masked_select(masks.squeeze(-1))
-                .sum()
-            )
+            # NOTE: The weights of the padded part are zero,
+            # so the weighted losses can be summed without masked_select
+            l1_loss = l1_loss.mul(out_weights).sum()
+            mse_loss = mse_loss.mul(out_weights).sum()
+            bce_loss = bce_loss.mul(logit_weights.squeeze(-1)).sum()
 
         return l1_loss, mse_loss, bce_loss
 
@@ -719,8 +736,9 @@ class Tacotron2(TTSInterface, torch.nn.Module):
 
         """
         # remove unnecessary padded part (for multi-gpus)
-        max_in = max(ilens)
-        max_out = max(olens)
+        # NOTE: reduce on the device not to sync every element with the host
+        max_in = int(ilens.max())
+        max_out = int(olens.max())
         if max_in != xs.shape[1]:
             xs = xs[:, :max_in]
         if max_out != ys.shape[1]:
@@ -739,8 +757,8 @@ class Tacotron2(TTSInterface, torch.nn.Module):
             assert olens.ge(
                 self.reduction_factor
             ).all(), "Output length must be greater than or equal to reduction factor."
-            olens = olens.new([olen - olen % self.reduction_factor for olen in olens])
-            max_out = max(olens)
+            olens = olens - olens % self.reduction_factor
+            max_out = int(olens.max())
             ys = ys[:, :max_out]
             labels = labels[:, :max_out]
             labels = torch.scatter(
@@ -840,6 +858,59 @@ class Tacotron2(TTSInterface, torch.nn.Module):
         else:
             return outs, probs, att_ws
 
+    def batch_inference(self, xs, ilens, inference_args, spembs=None, *args, **kwargs):
+        """Generate the sequences of features given the batch of characters.
+
+        Args:
+            xs (Tensor): Batch of padded character ids (B, Tmax).
+            ilens (LongTensor): Batch of lengths of each input batch (B,).
+            inference_args (Namespace):
+                - threshold (float): Threshold in inference.
+                - minlenratio (float): Minimum length ratio in inference.
+                - maxlenratio (float): Maximum length ratio in inference.
+            spembs (Tensor, optional):
+                Batch of speaker embedding vectors (B, spk_embed_dim).
+
+        Returns:
+            List[Tensor]: List of output sequences of features (L_i, odim).
+            List[Tensor]: List of output sequences of stop probabilities (L_i,).
+            List[Tensor]: List of attention weights (L_i, T_i).
+
+        """
+        if getattr(inference_args, "use_att_constraint", False):
+            raise NotImplementedError(
+                "attention constraint is not supported in batch inference."
+            )
+
+        # sort the inputs in descending order of length for the packed encoder
+        ilens = torch.as_tensor(ilens)
+        ilens, sort_idx = ilens.sort(descending=True)
+        xs = xs[sort_idx.to(xs.device), : int(ilens[0])]
+
+        # inference
+        hs, hlens = self.enc(xs, ilens)
+        if self.spk_embed_dim is not None:
+            spembs = spembs[sort_idx.to(spembs.device)]
+            spembs = F.normalize(spembs).unsqueeze(1).expand(-1, hs.size(1), -1)
+            hs = torch.cat([hs, spembs], dim=-1)
+        outs, probs, att_ws = self.dec.batch_inference(
+            hs,
+            hlens,
+            inference_args.threshold,
+            inference_args.minlenratio,
+            inference_args.maxlenratio,
+        )
+        if self.use_cbhg:
+            outs = [self.cbhg.inference(out) for out in outs]
+
+        # restore the original order
+        orig_idx = sort_idx.argsort().tolist()
+        outs = [outs[i] for i in orig_idx]
+        probs = [probs[i] for i in orig_idx]
+        att_ws = [att_ws[i] for i in orig_idx]
+
+        return outs, probs, att_ws
+
     def calculate_all_attentions(
         self, xs, ilens, ys, spembs=None, keep_tensor=False, *args, **kwargs
     ):
@@ -876,6 +947,15 @@ class Tacotron2(TTSInterface, torch.nn.Module):
         else:
             return att_ws.cpu().numpy()
 
+    def fuse_conv_bn(self):
+        """Fold batch normalization into the convolution layers for inference.
+
+        The module must be in evaluation mode and cannot be trained afterwards.
+
+        """
+        self.enc.fuse_conv_bn()
+        self.dec.fuse_conv_bn()
+
     @property
     def base_plot_keys(self):
         """Return base key names to plot during training.
@@ -91,6 +91,25 @@ def pad_list_even_max_length(xs, pad_value):
 
     return pad
 
+
+# torch.arange(n) per device, from which the masks slice their position indices
+_ARANGE_CACHE: Dict[torch.device, torch.Tensor] = {}
+# NOTE: torch.jit.is_tracing is not available in old pytorch
+_is_tracing = getattr(torch.jit, "is_tracing", lambda: False)
+
+
+def _cached_arange(maxlen, device):
+    """Return torch.arange(maxlen) as a view of a tensor cached per device."""
+    if _is_tracing():
+        # the cached tensor would be recorded as a constant of the graph
+        return torch.arange(0, maxlen, dtype=torch.int64, device=device)
+    base = _ARANGE_CACHE.get(device)
+    if base is None or base.numel() < maxlen:
+        base = torch.arange(0, max(maxlen, 4096), dtype=torch.int64, device=device)
+        _ARANGE_CACHE[device] = base
+    return base[:maxlen]
+
+
 def make_pad_mask(lengths, xs=None, length_dim=-1):
     """Make mask tensor containing indices of padded part.
 
@@ -102,9 +121,7 @@ def make_pad_mask(lengths, xs=None, length_dim=-1):
             See the example.
 
     Returns:
-        Tensor: Mask tensor containing indices of padded part.
-                dtype=torch.uint8 in PyTorch 1.2-
-                dtype=torch.bool in PyTorch 1.2+ (including 1.2)
+        BoolTensor: Mask tensor containing indices of padded part.
 
     Examples:
         With only lengths.
@@ -180,18 +197,20 @@ def make_pad_mask(lengths, xs=None, length_dim=-1):
     if length_dim == 0:
         raise ValueError("length_dim cannot be 0: {}".format(length_dim))
 
-    if not isinstance(lengths, list):
-        lengths = lengths.tolist()
-    bs = int(len(lengths))
     if xs is None:
+        if not isinstance(lengths, list):
+            lengths = lengths.tolist()
         maxlen = int(max(lengths))
+        lengths = torch.tensor(lengths, dtype=torch.int64)
     else:
+        # Build the mask on the device of the reference tensor
+        # without copying the lengths to the host
         maxlen = xs.size(length_dim)
+        lengths = torch.as_tensor(lengths, dtype=torch.int64, device=xs.device)
+    bs = int(lengths.size(0))
 
-    seq_range = torch.arange(0, maxlen, dtype=torch.int64)
-    seq_range_expand = seq_range.unsqueeze(0).expand(bs, maxlen)
-    seq_length_expand = seq_range_expand.new(lengths).unsqueeze(-1)
-    mask = seq_range_expand >= seq_length_expand
+    seq_range = _cached_arange(maxlen, lengths.device)
+    mask = seq_range.unsqueeze(0) >= lengths.unsqueeze(-1)
 
     if xs is not None:
         assert xs.size(0) == bs, (xs.size(0), bs)
@@ -202,7 +221,7 @@ def make_pad_mask(lengths, xs=None, length_dim=-1):
         ind = tuple(
             slice(None) if i in (0, length_dim) else None for i in range(xs.dim())
         )
-        mask = mask[ind].expand_as(xs).to(xs.device)
+        mask = mask[ind].expand_as(xs)
     return mask
 
 
@@ -217,9 +236,7 @@ def make_non_pad_mask(lengths, xs=None, length_dim=-1):
             See the example.
 
     Returns:
-        ByteTensor: mask tensor containing indices of padded part.
-                    dtype=torch.uint8 in PyTorch 1.2-
-                    dtype=torch.bool in PyTorch 1.2+ (including 1.2)
+        BoolTensor: mask tensor containing indices of non-padded part.
 
     Examples:
         With only lengths.
@@ -526,3 +543,38 @@ def get_activation(act):
     }
 
     return activation_funcs[act]()
+
+
+def fuse_conv_bn(layers):
+    """Fold batch normalization into the preceding convolution for inference.
+
+    Args:
+        layers (torch.nn.Module): Stack of `torch.nn.Sequential` whose first
+            modules may be `torch.nn.Conv1d` followed by `torch.nn.BatchNorm1d`.
+            The stack is modified in place and must be in evaluation mode.
+
+    Examples:
+        >>> layers = torch.nn.ModuleList(
+        ...     [torch.nn.Sequential(torch.nn.Conv1d(2, 3, 1), torch.nn.BatchNorm1d(3))]
+        ... ).eval()
+        >>> fuse_conv_bn(layers)
+        >>> layers
+        ModuleList(
+          (0): Sequential(
+            (0): Conv1d(2, 3, kernel_size=(1,), stride=(1,))
+          )
+        )
+
+    """
+    from torch.nn.utils.fusion import fuse_conv_bn_eval
+
+    if layers.training:
+        raise RuntimeError("batch normalization can be fused only in eval mode")
+    for i, layer in enumerate(layers):
+        if (
+            len(layer) > 1
+            and isinstance(layer[0], torch.nn.Conv1d)
+            and isinstance(layer[1], torch.nn.BatchNorm1d)
+        ):
+            conv = fuse_conv_bn_eval(layer[0], layer[1])
+            layers[i] = torch.nn.Sequential(conv, *list(layer)[2:])
@@ -1,7 +1,6 @@
 """Attention modules for RNN."""
 
 import math
-import six
 
 import torch
 import torch.nn.functional as F
@@ -862,7 +861,7 @@ class AttMultiHeadDot(torch.nn.Module):
         self.mlp_q = torch.nn.ModuleList()
         self.mlp_k = torch.nn.ModuleList()
         self.mlp_v = torch.nn.ModuleList()
-        for _ in six.moves.range(aheads):
+        for _ in range(aheads):
             self.mlp_q += [torch.nn.Linear(dunits, att_dim_k)]
             self.mlp_k += [torch.nn.Linear(eprojs, att_dim_k, bias=False)]
             self.mlp_v += [torch.nn.Linear(eprojs, att_dim_v, bias=False)]
@@ -908,17 +907,14 @@ class AttMultiHeadDot(torch.nn.Module):
             self.h_length = self.enc_h.size(1)
             # utt x frame x att_dim
             self.pre_compute_k = [
-                torch.tanh(self.mlp_k[h](self.enc_h))
-                for h in six.moves.range(self.aheads)
+                torch.tanh(self.mlp_k[h](self.enc_h)) for h in range(self.aheads)
             ]
 
         if self.pre_compute_v is None or self.han_mode:
             self.enc_h = enc_hs_pad  # utt x frame x hdim
             self.h_length = self.enc_h.size(1)
             # utt x frame x att_dim
-            self.pre_compute_v = [
-                self.mlp_v[h](self.enc_h) for h in six.moves.range(self.aheads)
-            ]
+            self.pre_compute_v = [self.mlp_v[h](self.enc_h) for h in range(self.aheads)]
 
         if dec_z is None:
             dec_z = enc_hs_pad.new_zeros(batch, self.dunits)
@@ -927,7 +923,7 @@ class AttMultiHeadDot(torch.nn.Module):
 
         c = []
         w = []
-        for h in six.moves.range(self.aheads):
+        for h in range(self.aheads):
             e = torch.sum(
                 self.pre_compute_k[h]
                 * torch.tanh(self.mlp_q[h](dec_z)).view(batch, 1, self.att_dim_k),
@@ -978,7 +974,7 @@ class AttMultiHeadAdd(torch.nn.Module):
         self.mlp_k = torch.nn.ModuleList()
         self.mlp_v = torch.nn.ModuleList()
         self.gvec = torch.nn.ModuleList()
-        for _ in six.moves.range(aheads):
+        for _ in range(aheads):
             self.mlp_q += [torch.nn.Linear(dunits, att_dim_k)]
             self.mlp_k += [torch.nn.Linear(eprojs, att_dim_k, bias=False)]
             self.mlp_v += [torch.nn.Linear(eprojs, att_dim_v, bias=False)]
@@ -1024,17 +1020,13 @@ class AttMultiHeadAdd(torch.nn.Module):
             self.enc_h = enc_hs_pad  # utt x frame x hdim
             self.h_length = self.enc_h.size(1)
             # utt x frame x att_dim
-            self.pre_compute_k = [
-                self.mlp_k[h](self.enc_h) for h in six.moves.range(self.aheads)
-            ]
+            self.pre_compute_k = [self.mlp_k[h](self.enc_h) for h in range(self.aheads)]
 
         if self.pre_compute_v is None or self.han_mode:
             self.enc_h = enc_hs_pad  # utt x frame x hdim
             self.h_length = self.enc_h.size(1)
             # utt x frame x att_dim
-            self.pre_compute_v = [
-                self.mlp_v[h](self.enc_h) for h in six.moves.range(self.aheads)
-            ]
+            self.pre_compute_v = [self.mlp_v[h](self.enc_h) for h in range(self.aheads)]
 
         if dec_z is None:
             dec_z = enc_hs_pad.new_zeros(batch, self.dunits)
@@ -1043,7 +1035,7 @@ class AttMultiHeadAdd(torch.nn.Module):
 
         c = []
         w = []
-        for h in six.moves.range(self.aheads):
+        for h in range(self.aheads):
             e = self.gvec[h](
                 torch.tanh(
                     self.pre_compute_k[h]
@@ -1109,7 +1101,7 @@ class AttMultiHeadLoc(torch.nn.Module):
         self.gvec = torch.nn.ModuleList()
         self.loc_conv = torch.nn.ModuleList()
         self.mlp_att = torch.nn.ModuleList()
-        for _ in six.moves.range(aheads):
+        for _ in range(aheads):
             self.mlp_q += [torch.nn.Linear(dunits, att_dim_k)]
             self.mlp_k += [torch.nn.Linear(eprojs, att_dim_k, bias=False)]
             self.mlp_v += [torch.nn.Linear(eprojs, att_dim_v, bias=False)]
@@ -1167,17 +1159,13 @@ class AttMultiHeadLoc(torch.nn.Module):
             self.enc_h = enc_hs_pad  # utt x frame x hdim
             self.h_length = self.enc_h.size(1)
             # utt x frame x att_dim
-            self.pre_compute_k = [
-                self.mlp_k[h](self.enc_h) for h in six.moves.range(self.aheads)
-            ]
+            self.pre_compute_k = [self.mlp_k[h](self.enc_h) for h in range(self.aheads)]
 
         if self.pre_compute_v is None or self.han_mode:
             self.enc_h = enc_hs_pad  # utt x frame x hdim
             self.h_length = self.enc_h.size(1)
             # utt x frame x att_dim
-            self.pre_compute_v = [
-                self.mlp_v[h](self.enc_h) for h in six.moves.range(self.aheads)
-            ]
+            self.pre_compute_v = [self.mlp_v[h](self.enc_h) for h in range(self.aheads)]
 
         if dec_z is None:
             dec_z = enc_hs_pad.new_zeros(batch, self.dunits)
@@ -1186,7 +1174,7 @@ class AttMultiHeadLoc(torch.nn.Module):
 
         if att_prev is None:
             att_prev = []
-            for _ in six.moves.range(self.aheads):
+            for _ in range(self.aheads):
                 # if no bias, 0 0-pad goes 0
                 mask = 1.0 - make_pad_mask(enc_hs_len).float()
                 att_prev += [
@@ -1195,7 +1183,7 @@ class AttMultiHeadLoc(torch.nn.Module):
 
         c = []
         w = []
-        for h in six.moves.range(self.aheads):
+        for h in range(self.aheads):
             att_conv = self.loc_conv[h](att_prev[h].view(batch, 1, 1, self.h_length))
             att_conv = att_conv.squeeze(2).transpose(1, 2)
             att_conv = self.mlp_att[h](att_conv)
@@ -1269,7 +1257,7 @@ class AttMultiHeadMultiResLoc(torch.nn.Module):
         self.gvec = torch.nn.ModuleList()
         self.loc_conv = torch.nn.ModuleList()
         self.mlp_att = torch.nn.ModuleList()
-        for h in six.moves.range(aheads):
+        for h in range(aheads):
             self.mlp_q += [torch.nn.Linear(dunits, att_dim_k)]
             self.mlp_k += [torch.nn.Linear(eprojs, att_dim_k, bias=False)]
             self.mlp_v += [torch.nn.Linear(eprojs, att_dim_v, bias=False)]
@@ -1323,17 +1311,13 @@ class AttMultiHeadMultiResLoc(torch.nn.Module):
             self.enc_h = enc_hs_pad  # utt x frame x hdim
             self.h_length = self.enc_h.size(1)
             # utt x frame x att_dim
-            self.pre_compute_k = [
-                self.mlp_k[h](self.enc_h) for h in six.moves.range(self.aheads)
-            ]
+            self.pre_compute_k = [self.mlp_k[h](self.enc_h) for h in range(self.aheads)]
 
         if self.pre_compute_v is None or self.han_mode:
             self.enc_h = enc_hs_pad  # utt x frame x hdim
             self.h_length = self.enc_h.size(1)
             # utt x frame x att_dim
-            self.pre_compute_v = [
-                self.mlp_v[h](self.enc_h) for h in six.moves.range(self.aheads)
-            ]
+            self.pre_compute_v = [self.mlp_v[h](self.enc_h) for h in range(self.aheads)]
 
         if dec_z is None:
             dec_z = enc_hs_pad.new_zeros(batch, self.dunits)
@@ -1342,7 +1326,7 @@ class AttMultiHeadMultiResLoc(torch.nn.Module):
 
         if att_prev is None:
             att_prev = []
-            for _ in six.moves.range(self.aheads):
+            for _ in range(self.aheads):
                 # if no bias, 0 0-pad goes 0
                 mask = 1.0 - make_pad_mask(enc_hs_len).float()
                 att_prev += [
@@ -1351,7 +1335,7 @@ class AttMultiHeadMultiResLoc(torch.nn.Module):
 
         c = []
         w = []
-        for h in six.moves.range(self.aheads):
+        for h in range(self.aheads):
             att_conv = self.loc_conv[h](att_prev[h].view(batch, 1, 1, self.h_length))
             att_conv = att_conv.squeeze(2).transpose(1, 2)
             att_conv = self.mlp_att[h](att_conv)
@@ -1798,7 +1782,7 @@ def att_to_numpy(att_ws, att):
         # att_ws => list of list of each head attention
         n_heads = len(att_ws[0])
         att_ws_sorted_by_head = []
-        for h in six.moves.range(n_heads):
+        for h in range(n_heads):
             att_ws_head = torch.stack([aw[h] for aw in att_ws], dim=1)
             att_ws_sorted_by_head += [att_ws_head]
         att_ws = torch.stack(att_ws_sorted_by_head, dim=1).cpu().numpy()
@@ -43,7 +43,7 @@ class CBHGLoss(torch.nn.Module):
         """
         # perform masking for padded values
         if self.use_masking:
-            mask = make_non_pad_mask(olens).unsqueeze(-1).to(spcs.device)
+            mask = make_non_pad_mask(olens, spcs[:, :, 0], 1).unsqueeze(-1)
             spcs = spcs.masked_select(mask)
             cbhg_outs = cbhg_outs.masked_select(mask)
 
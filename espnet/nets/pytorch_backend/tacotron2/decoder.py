@@ -6,13 +6,21 @@
 
 """Tacotron2 decoder related modules."""
 
-import six
+import weakref
+
+from typing import List
+from typing import Tuple
 
 import torch
 import torch.nn.functional as F
 
+from espnet.nets.pytorch_backend.nets_utils import fuse_conv_bn
 from espnet.nets.pytorch_backend.rnn.attentions import AttForwardTA
 
+# compiled copies of the decoder lstm stacks used in evaluation mode,
+# which are kept out of the modules not to be saved or copied with them
+_SCRIPTED_LSTM = weakref.WeakKeyDictionary()
+
 
 def decoder_init(m):
     """Initialize decoder parameters."""
@@ -57,7 +65,7 @@ class ZoneOutCell(torch.nn.Module):
                 "zoneout probability must be in the range from 0.0 to 1.0."
             )
 
-    def forward(self, inputs, hidden):
+    def forward(self, inputs, hidden: Tuple[torch.Tensor, torch.Tensor]):
         """Calculate forward propagation.
 
         Args:
@@ -73,24 +81,55 @@ class ZoneOutCell(torch.nn.Module):
 
         """
         next_hidden = self.cell(inputs, hidden)
-        next_hidden = self._zoneout(hidden, next_hidden, self.zoneout_rate)
-        return next_hidden
-
-    def _zoneout(self, h, next_h, prob):
-        # apply recursively
-        if isinstance(h, tuple):
-            num_h = len(h)
-            if not isinstance(prob, tuple):
-                prob = tuple([prob] * num_h)
-            return tuple(
-                [self._zoneout(h[i], next_h[i], prob[i]) for i in range(num_h)]
-            )
+        # NOTE: h and c are handled explicitly to keep this module scriptable
+        next_h = self._zoneout(hidden[0], next_hidden[0], self.zoneout_rate)
+        next_c = self._zoneout(hidden[1], next_hidden[1], self.zoneout_rate)
+        return next_h, next_c
 
+    def _zoneout(self, h: torch.Tensor, next_h: torch.Tensor, prob: float):
         if self.training:
-            mask = h.new(*h.size()).bernoulli_(prob)
-            return mask * h + (1 - mask) * next_h
+            mask = torch.empty_like(h).bernoulli_(prob)
+            return torch.lerp(next_h, h, mask)
         else:
-            return prob * h + (1 - prob) * next_h
+            return torch.lerp(next_h, h, prob)
+
+
+class LSTMStack(torch.nn.ModuleList):
+    """Stack of LSTM cells which is run at once for each step of the decoder.
+
+    The stack can be compiled with `torch.jit.script` to avoid the Python overhead
+    of calling the cells one by one.
+
+    """
+
+    def forward(
+        self,
+        xs: torch.Tensor,
+        z_list: List[torch.Tensor],
+        c_list: List[torch.Tensor],
+    ) -> Tuple[List[torch.Tensor], List[torch.Tensor]]:
+        """Calculate forward propagation.
+
+        Args:
+            xs (Tensor): Batch of input tensor (B, input_size).
+            z_list (List[Tensor]): Hidden states of each cell [(B, hidden_size), ...].
+            c_list (List[Tensor]): Cell states of each cell [(B, hidden_size), ...].
+
+        Returns:
+            List[Tensor]: Next hidden states of each cell [(B, hidden_size), ...].
+            List[Tensor]: Next cell states of each cell [(B, hidden_size), ...].
+
+        """
+        next_z_list: List[torch.Tensor] = []
+        next_c_list: List[torch.Tensor] = []
+        i = 0
+        for cell in self:
+            z, c = cell(xs, (z_list[i], c_list[i]))
+            next_z_list.append(z)
+            next_c_list.append(c)
+            xs = z
+            i += 1
+        return next_z_list, next_c_list
 
 
 class Prenet(torch.nn.Module):
@@ -126,7 +165,7 @@ class Prenet(torch.nn.Module):
         super(Prenet, self).__init__()
         self.dropout_rate = dropout_rate
         self.prenet = torch.nn.ModuleList()
-        for layer in six.moves.range(n_layers):
+        for layer in range(n_layers):
             n_inputs = idim if layer == 0 else n_units
             self.prenet += [
                 torch.nn.Sequential(torch.nn.Linear(n_inputs, n_units), torch.nn.ReLU())
@@ -142,8 +181,10 @@ class Prenet(torch.nn.Module):
             Tensor: Batch of output tensors (B, ..., odim).
 
         """
-        for i in six.moves.range(len(self.prenet)):
-            x = F.dropout(self.prenet[i](x), self.dropout_rate)
+        # NOTE: the activations are applied functionally to skip the Sequential
+        #   and ReLU module calls, which are run at every step of the decoder
+        for layer in self.prenet:
+            x = F.dropout(F.relu(layer[0](x), inplace=True), self.dropout_rate)
         return x
 
 
@@ -186,7 +227,7 @@ class Postnet(torch.nn.Module):
         """
         super(Postnet, self).__init__()
         self.postnet = torch.nn.ModuleList()
-        for layer in six.moves.range(n_layers - 1):
+        for layer in range(n_layers - 1):
             ichans = odim if layer == 0 else n_chans
             ochans = odim if layer == n_layers - 1 else n_chans
             if use_batch_norm:
@@ -250,6 +291,8 @@ class Postnet(torch.nn.Module):
                     torch.nn.Dropout(dropout_rate),
                 )
             ]
+        # NOTE: the layers are chained by Sequential with the same parameter names
+        self.postnet = torch.nn.Sequential(*self.postnet)
 
     def forward(self, xs):
         """Calculate forward propagation.
@@ -261,9 +304,15 @@ class Postnet(torch.nn.Module):
             Tensor: Batch of padded output tensor. (B, odim, Tmax).
 
         """
-        for i in six.moves.range(len(self.postnet)):
-            xs = self.postnet[i](xs)
-        return xs
+        return self.postnet(xs)
+
+    def fuse_conv_bn(self):
+        """Fold batch normalization into the convolution layers for inference.
+
+        The module must be in evaluation mode and cannot be trained afterwards.
+
+        """
+        fuse_conv_bn(self.postnet)
 
 
 class Decoder(torch.nn.Module):
@@ -344,8 +393,8 @@ class Decoder(torch.nn.Module):
 
         # define lstm network
         prenet_units = prenet_units if prenet_layers != 0 else odim
-        self.lstm = torch.nn.ModuleList()
-        for layer in six.moves.range(dlayers):
+        self.lstm = LSTMStack()
+        for layer in range(dlayers):
             iunits = idim + prenet_units if layer == 0 else dunits
             lstm = torch.nn.LSTMCell(iunits, dunits)
             if zoneout_rate > 0.0:
@@ -385,10 +434,29 @@ class Decoder(torch.nn.Module):
         # initialize
         self.apply(decoder_init)
 
+    def fuse_conv_bn(self):
+        """Fold batch normalization into the postnet for inference.
+
+        The module must be in evaluation mode and cannot be trained afterwards.
+
+        """
+        if self.postnet is not None:
+            self.postnet.fuse_conv_bn()
+
     def _zero_state(self, hs):
         init_hs = hs.new_zeros(hs.size(0), self.lstm[0].hidden_size)
         return init_hs
 
+    def _inference_lstm(self):
+        """Return the lstm stack compiled with TorchScript in evaluation mode."""
+        if self.training:
+            return self.lstm
+        # NOTE: the cells are replaced e.g. in dynamic quantization
+        key = tuple(map(id, self.lstm.modules()))
+        if _SCRIPTED_LSTM.get(self, (None,))[0] != key:
+            _SCRIPTED_LSTM[self] = key, torch.jit.script(self.lstm)
+        return _SCRIPTED_LSTM[self][1]
+
     def forward(self, hs, hlens, ys):
         """Calculate forward propagation.
 
@@ -418,36 +486,38 @@ class Decoder(torch.nn.Module):
         # initialize hidden states of decoder
         c_list = [self._zero_state(hs)]
         z_list = [self._zero_state(hs)]
-        for _ in six.moves.range(1, len(self.lstm)):
+        for _ in range(1, len(self.lstm)):
             c_list += [self._zero_state(hs)]
             z_list += [self._zero_state(hs)]
         prev_out = hs.new_zeros(hs.size(0), self.odim)
 
+        # the prenet inputs are known in teacher-forcing,
+        # so the prenet is applied to the whole sequence at once
+        prev_outs = torch.cat([prev_out.unsqueeze(1), ys[:, :-1]], dim=1)
+        prenet_outs = self.prenet(prev_outs) if self.prenet is not None else prev_outs
+
         # initialize attention
         prev_att_w = None
         self.att.reset()
 
+        # bind the submodules to locals not to look them up at every step
+        att, lstm = self.att, self.lstm
+
         # loop for an output sequence
-        outs, logits, att_ws = [], [], []
-        for y in ys.transpose(0, 1):
+        zcs_list, att_ws = [], []
+        for y, prenet_out in zip(ys.transpose(0, 1), prenet_outs.transpose(0, 1)):
             if self.use_att_extra_inputs:
-                att_c, att_w = self.att(hs, hlens, z_list[0], prev_att_w, prev_out)
+                att_c, att_w = att(hs, hlens, z_list[0], prev_att_w, prev_out)
             else:
-                att_c, att_w = self.att(hs, hlens, z_list[0], prev_att_w)
-            prenet_out = self.prenet(prev_out) if self.prenet is not None else prev_out
+                att_c, att_w = att(hs, hlens, z_list[0], prev_att_w)
             xs = torch.cat([att_c, prenet_out], dim=1)
-            z_list[0], c_list[0] = self.lstm[0](xs, (z_list[0], c_list[0]))
-            for i in six.moves.range(1, len(self.lstm)):
-                z_list[i], c_list[i] = self.lstm[i](
-                    z_list[i - 1], (z_list[i], c_list[i])
-                )
+            z_list, c_list = lstm(xs, z_list, c_list)
             zcs = (
                 torch.cat([z_list[-1], att_c], dim=1)
                 if self.use_concate
                 else z_list[-1]
             )
-            outs += [self.feat_out(zcs).view(hs.size(0), self.odim, -1)]
-            logits += [self.prob_out(zcs)]
+            zcs_list += [zcs]
             att_ws += [att_w]
             prev_out = y  # teacher forcing
             if self.cumulate_att_w and prev_att_w is not None:
@@ -455,8 +525,16 @@ class Decoder(torch.nn.Module):
             else:
                 prev_att_w = att_w
 
-        logits = torch.cat(logits, dim=1)  # (B, Lmax)
-        before_outs = torch.cat(outs, dim=2)  # (B, odim, Lmax)
+        # the projections do not depend on the recurrence,
+        # so they are applied to all of the steps at once
+        zcs = torch.stack(zcs_list, dim=1)  # (B, Lmax/r, iunits)
+        logits = self.prob_out(zcs).view(hs.size(0), -1)  # (B, Lmax)
+        before_outs = (
+            self.feat_out(zcs)
+            .view(hs.size(0), zcs.size(1), self.odim, -1)
+            .permute(0, 2, 1, 3)
+            .reshape(hs.size(0), self.odim, -1)
+        )  # (B, odim, Lmax)
         att_ws = torch.stack(att_ws, dim=1)  # (B, Lmax, Tmax)
 
         if self.reduction_factor > 1:
@@ -526,7 +604,7 @@ class Decoder(torch.nn.Module):
         # initialize hidden states of decoder
         c_list = [self._zero_state(hs)]
         z_list = [self._zero_state(hs)]
-        for _ in six.moves.range(1, len(self.lstm)):
+        for _ in range(1, len(self.lstm)):
             c_list += [self._zero_state(hs)]
             z_list += [self._zero_state(hs)]
         prev_out = hs.new_zeros(1, self.odim)
@@ -541,16 +619,47 @@ class Decoder(torch.nn.Module):
         else:
             last_attended_idx = None
 
+        # bind the submodules to locals not to look them up at every step
+        att, lstm, prenet, feat_out, prob_out = (
+            self.att,
+            self._inference_lstm(),
+            self.prenet,
+            self.feat_out,
+            self.prob_out,
+        )
+
+        # preallocate the outputs of the longest possible sequence
+        # to write each step into them instead of concatenating at the end
+        r = self.reduction_factor
+        max_steps = max(-(-maxlen // r), -(-minlen // r), 1)
+        outs = hs.new_empty(1, self.odim, max_steps * r)
+        probs = hs.new_empty(max_steps * r)
+        # NOTE: the attention weights are kept in float32 under autocast since
+        #   the focus rates and durations are calculated from them
+        att_ws = hs.new_empty(
+            max_steps,
+            hs.size(1),
+            dtype=torch.float32
+            if hs.dtype in (torch.float16, torch.bfloat16)
+            else hs.dtype,
+        )
+
+        # NOTE: the lstm inputs are concatenated into the same tensor at every step
+        #   not to allocate it again, which is not supported by autograd
+        xs, reuse_xs = None, not torch.is_grad_enabled()
+
+        # syncing with the host at every step drains the stream on GPU
+        check_interval = 4 if hs.is_cuda else 1
+
         # loop for an output sequence
-        idx = 0
-        outs, att_ws, probs = [], [], []
+        idx, checked_idx = 0, 0
         while True:
             # updated index
             idx += self.reduction_factor
 
             # decoder calculation
             if self.use_att_extra_inputs:
-                att_c, att_w = self.att(
+                att_c, att_w = att(
                     hs,
                     ilens,
                     z_list[0],
@@ -561,7 +670,7 @@ class Decoder(torch.nn.Module):
                     forward_window=forward_window,
                 )
             else:
-                att_c, att_w = self.att(
+                att_c, att_w = att(
                     hs,
                     ilens,
                     z_list[0],
@@ -571,43 +680,57 @@ class Decoder(torch.nn.Module):
                     forward_window=forward_window,
                 )
 
-            att_ws += [att_w]
-            prenet_out = self.prenet(prev_out) if self.prenet is not None else prev_out
-            xs = torch.cat([att_c, prenet_out], dim=1)
-            z_list[0], c_list[0] = self.lstm[0](xs, (z_list[0], c_list[0]))
-            for i in six.moves.range(1, len(self.lstm)):
-                z_list[i], c_list[i] = self.lstm[i](
-                    z_list[i - 1], (z_list[i], c_list[i])
-                )
+            att_ws[idx // r - 1] = att_w[0]
+            prenet_out = prenet(prev_out) if prenet is not None else prev_out
+            if xs is None or not reuse_xs:
+                xs = torch.cat([att_c, prenet_out], dim=1)
+            else:
+                xs = torch.cat([att_c, prenet_out], dim=1, out=xs)
+            z_list, c_list = lstm(xs, z_list, c_list)
             zcs = (
                 torch.cat([z_list[-1], att_c], dim=1)
                 if self.use_concate
                 else z_list[-1]
             )
-            outs += [self.feat_out(zcs).view(1, self.odim, -1)]  # [(1, odim, r), ...]
-            probs += [torch.sigmoid(self.prob_out(zcs))[0]]  # [(r), ...]
+            out = feat_out(zcs).view(1, self.odim, -1)  # (1, odim, r)
+            prob = torch.sigmoid(prob_out(zcs))[0]  # (r)
+            outs[:, :, idx - r : idx] = out
+            probs[idx - r : idx] = prob
             if self.output_activation_fn is not None:
-                prev_out = self.output_activation_fn(outs[-1][:, :, -1])  # (1, odim)
+                prev_out = self.output_activation_fn(out[:, :, -1])  # (1, odim)
             else:
-                prev_out = outs[-1][:, :, -1]  # (1, odim)
+                prev_out = out[:, :, -1]  # (1, odim)
             if self.cumulate_att_w and prev_att_w is not None:
-                prev_att_w = prev_att_w + att_w  # Note: error when use +=
+                if att_w.requires_grad:
+                    prev_att_w = prev_att_w + att_w  # Note: error when use +=
+                else:
+                    # without autograd the weights can be accumulated in place
+                    prev_att_w.add_(att_w)
+            elif self.cumulate_att_w:
+                # copy not to accumulate into the returned attention weights
+                prev_att_w = att_w.clone()
             else:
                 prev_att_w = att_w
             if use_att_constraint:
                 last_attended_idx = int(att_w.argmax())
 
             # check whether to finish generation
-            if int(sum(probs[-1] >= threshold)) > 0 or idx >= maxlen:
-                # check mininum length
-                if idx < minlen:
+            # NOTE: the stop probabilities are synced only every check_interval steps
+            #   and the output is trimmed to the first step satisfying the condition
+            if idx - checked_idx >= check_interval * r or idx >= maxlen:
+                step_idxs = torch.arange(checked_idx + r, idx + 1, r)
+                stops = (probs[checked_idx:idx].view(-1, r) >= threshold).any(dim=1)
+                stops = (stops.cpu() | (step_idxs >= maxlen)) & (step_idxs >= minlen)
+                checked_idx = idx
+                if not bool(stops.any()):
                     continue
-                outs = torch.cat(outs, dim=2)  # (1, odim, L)
+                idx = int(step_idxs[stops][0])
+                outs = outs[:, :, :idx]  # (1, odim, L)
                 if self.postnet is not None:
                     outs = outs + self.postnet(outs)  # (1, odim, L)
                 outs = outs.transpose(2, 1).squeeze(0)  # (L, odim)
-                probs = torch.cat(probs, dim=0)
-                att_ws = torch.cat(att_ws, dim=0)
+                probs = probs[:idx]
+                att_ws = att_ws[: idx // r]
                 break
 
         if self.output_activation_fn is not None:
@@ -615,6 +738,143 @@ class Decoder(torch.nn.Module):
 
         return outs, probs, att_ws
 
+    def batch_inference(
+        self,
+        hs,
+        hlens,
+        threshold=0.5,
+        minlenratio=0.0,
+        maxlenratio=10.0,
+    ):
+        """Generate the sequences of features given the batch of encoder states.
+
+        Every sequence is generated until its own stop probability exceeds the
+        threshold, and the loop continues until all of the sequences are finished.
+
+        Args:
+            hs (Tensor): Batch of the sequences of padded hidden states (B, Tmax, idim).
+            hlens (LongTensor): Batch of lengths of each input batch (B,).
+            threshold (float, optional): Threshold to stop generation.
+            minlenratio (float, optional): Minimum length ratio.
+            maxlenratio (float, optional): Maximum length ratio.
+
+        Returns:
+            List[Tensor]: List of output sequences of features (L_i, odim).
+            List[Tensor]: List of output sequences of stop probabilities (L_i,).
+            List[Tensor]: List of attention weights (L_i / r, T_i).
+
+        Note:
+            This computation is performed in auto-regressive manner.
+            The attention constraint is not supported.
+
+        """
+        # setup
+        assert len(hs.size()) == 3
+        hlens = [int(hlen) for hlen in hlens]
+        batch_size = hs.size(0)
+        maxlens = torch.tensor(
+            [int(hlen * maxlenratio) for hlen in hlens], device=hs.device
+        )
+        minlens = torch.tensor(
+            [int(hlen * minlenratio) for hlen in hlens], device=hs.device
+        )
+
+        # initialize hidden states of decoder
+        c_list = [self._zero_state(hs)]
+        z_list = [self._zero_state(hs)]
+        for _ in range(1, len(self.lstm)):
+            c_list += [self._zero_state(hs)]
+            z_list += [self._zero_state(hs)]
+        prev_out = hs.new_zeros(batch_size, self.odim)
+
+        # initialize attention
+        prev_att_w = None
+        self.att.reset()
+
+        # bind the submodules to locals not to look them up at every step
+        att, lstm, prenet, feat_out, prob_out = (
+            self.att,
+            self._inference_lstm(),
+            self.prenet,
+            self.feat_out,
+            self.prob_out,
+        )
+
+        # loop for an output sequence
+        idx = 0
+        outs, att_ws, probs = [], [], []
+        finished = torch.zeros(batch_size, dtype=torch.bool, device=hs.device)
+        olens = torch.zeros(batch_size, dtype=torch.long, device=hs.device)
+        while True:
+            # updated index
+            idx += self.reduction_factor
+
+            # decoder calculation
+            if self.use_att_extra_inputs:
+                att_c, att_w = att(hs, hlens, z_list[0], prev_att_w, prev_out)
+            else:
+                att_c, att_w = att(hs, hlens, z_list[0], prev_att_w)
+
+            att_ws += [att_w]
+            prenet_out = prenet(prev_out) if prenet is not None else prev_out
+            xs = torch.cat([att_c, prenet_out], dim=1)
+            z_list, c_list = lstm(xs, z_list, c_list)
+            zcs = (
+                torch.cat([z_list[-1], att_c], dim=1)
+                if self.use_concate
+                else z_list[-1]
+            )
+            outs += [feat_out(zcs).view(batch_size, self.odim, -1)]  # (B, odim, r)
+            probs += [torch.sigmoid(prob_out(zcs))]  # (B, r)
+            if self.output_activation_fn is not None:
+                prev_out = self.output_activation_fn(outs[-1][:, :, -1])  # (B, odim)
+            else:
+                prev_out = outs[-1][:, :, -1]  # (B, odim)
+            if self.cumulate_att_w and prev_att_w is not None:
+                if att_w.requires_grad:
+                    prev_att_w = prev_att_w + att_w  # Note: error when use +=
+                else:
+                    # without autograd the weights can be accumulated in place
+                    prev_att_w.add_(att_w)
+            elif self.cumulate_att_w:
+                # copy not to accumulate into the returned attention weights
+                prev_att_w = att_w.clone()
+            else:
+                prev_att_w = att_w
+
+            # check whether to finish generation of each sequence
+            stop = (probs[-1] >= threshold).any(dim=1) | (maxlens <= idx)
+            stop = stop & (minlens <= idx) & ~finished
+            olens.masked_fill_(stop, idx)
+            finished |= stop
+            # NOTE: reduce on the device so that only one value is synced per step
+            if bool(finished.all()):
+                break
+
+        outs = torch.cat(outs, dim=2)  # (B, odim, Lmax)
+        probs = torch.cat(probs, dim=1)  # (B, Lmax)
+        att_ws = torch.stack(att_ws, dim=1)  # (B, Lmax / r, Tmax)
+
+        # trim the outputs beyond the stop index of each sequence
+        olens = olens.tolist()
+        outs = [out[:, :olen] for out, olen in zip(outs, olens)]
+        probs = [prob[:olen] for prob, olen in zip(probs, olens)]
+        att_ws = [
+            att_w[: olen // self.reduction_factor, :hlen]
+            for att_w, olen, hlen in zip(att_ws, olens, hlens)
+        ]
+
+        # NOTE: the postnet is applied to each sequence separately
+        #   not to convolve the frames beyond the stop index into the outputs
+        if self.postnet is not None:
+            outs = [out + self.postnet(out.unsqueeze(0))[0] for out in outs]
+        outs = [out.transpose(0, 1) for out in outs]  # [(L_i, odim), ...]
+
+        if self.output_activation_fn is not None:
+            outs = [self.output_activation_fn(out) for out in outs]
+
+        return outs, probs, att_ws
+
     def calculate_all_attentions(self, hs, hlens, ys):
         """Calculate all of the attention weights.
 
@@ -638,33 +898,41 @@ class Decoder(torch.nn.Module):
         # length list should be list of int
         hlens = list(map(int, hlens))
 
-        # initialize hidden states of decoder
-        c_list = [self._zero_state(hs)]
-        z_list = [self._zero_state(hs)]
-        for _ in six.moves.range(1, len(self.lstm)):
-            c_list += [self._zero_state(hs)]
-            z_list += [self._zero_state(hs)]
+        # initialize hidden states of the first lstm cell
+        # NOTE: the other cells do not feed back into the attention in
+        #   teacher-forcing, so they are not needed to calculate the weights
+        z, c = self._zero_state(hs), self._zero_state(hs)
         prev_out = hs.new_zeros(hs.size(0), self.odim)
 
+        # the prenet inputs are known in teacher-forcing,
+        # so the prenet is applied to the whole sequence at once
+        prev_outs = torch.cat([prev_out.unsqueeze(1), ys[:, :-1]], dim=1)
+        prenet_outs = self.prenet(prev_outs) if self.prenet is not None else prev_outs
+
         # initialize attention
         prev_att_w = None
         self.att.reset()
 
+        # bind the submodules to locals not to look them up at every step
+        att, lstm = self.att, self.lstm[0]
+
+        # NOTE: the lstm inputs are concatenated into the same tensor at every step
+        #   not to allocate it again, which is not supported by autograd
+        xs, reuse_xs = None, not torch.is_grad_enabled()
+
         # loop for an output sequence
         att_ws = []
-        for y in ys.transpose(0, 1):
+        for y, prenet_out in zip(ys.transpose(0, 1), prenet_outs.transpose(0, 1)):
             if self.use_att_extra_inputs:
-                att_c, att_w = self.att(hs, hlens, z_list[0], prev_att_w, prev_out)
+                att_c, att_w = att(hs, hlens, z, prev_att_w, prev_out)
             else:
-                att_c, att_w = self.att(hs, hlens, z_list[0], prev_att_w)
+                att_c, att_w = att(hs, hlens, z, prev_att_w)
             att_ws += [att_w]
-            prenet_out = self.prenet(prev_out) if self.prenet is not None else prev_out
-            xs = torch.cat([att_c, prenet_out], dim=1)
-            z_list[0], c_list[0] = self.lstm[0](xs, (z_list[0], c_list[0]))
-            for i in six.moves.range(1, len(self.lstm)):
-                z_list[i], c_list[i] = self.lstm[i](
-                    z_list[i - 1], (z_list[i], c_list[i])
-                )
+            if xs is None or not reuse_xs:
+                xs = torch.cat([att_c, prenet_out], dim=1)
+            else:
+                xs = torch.cat([att_c, prenet_out], dim=1, out=xs)
+            z, c = lstm(xs, (z, c))
             prev_out = y  # teacher forcing
             if self.cumulate_att_w and prev_att_w is not None:
                 prev_att_w = prev_att_w + att_w  # Note: error when use +=
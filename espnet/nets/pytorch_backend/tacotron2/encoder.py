@@ -6,13 +6,13 @@
 
 """Tacotron2 encoder related modules."""
 
-import six
-
 import torch
 
 from torch.nn.utils.rnn import pack_padded_sequence
 from torch.nn.utils.rnn import pad_packed_sequence
 
+from espnet.nets.pytorch_backend.nets_utils import fuse_conv_bn
+
 
 def encoder_init(m):
     """Initialize encoder parameters."""
@@ -79,7 +79,7 @@ class Encoder(torch.nn.Module):
 
         if econv_layers > 0:
             self.convs = torch.nn.ModuleList()
-            for layer in six.moves.range(econv_layers):
+            for layer in range(econv_layers):
                 ichans = (
                     embed_dim if layer == 0 and input_layer == "embed" else econv_chans
                 )
@@ -127,6 +127,14 @@ class Encoder(torch.nn.Module):
         # initialize
         self.apply(encoder_init)
 
+    def _apply(self, *args, **kwargs):
+        """Flatten the BLSTM weights once after they are moved or cast."""
+        ret = super(Encoder, self)._apply(*args, **kwargs)
+        # NOTE: dynamically quantized LSTM does not have flatten_parameters
+        if isinstance(self.blstm, torch.nn.LSTM):
+            self.blstm.flatten_parameters()
+        return ret
+
     def forward(self, xs, ilens=None):
         """Calculate forward propagation.
 
@@ -141,19 +149,29 @@ class Encoder(torch.nn.Module):
             LongTensor: Batch of lengths of each sequence (B,)
 
         """
-        xs = self.embed(xs).transpose(1, 2)
+        # (B, C, Tmax) in contiguous memory for the convolution stack
+        xs = self.embed(xs).transpose(1, 2).contiguous()
         if self.convs is not None:
-            for i in six.moves.range(len(self.convs)):
+            for conv in self.convs:
                 if self.use_residual:
-                    xs += self.convs[i](xs)
+                    xs += conv(xs)
                 else:
-                    xs = self.convs[i](xs)
+                    xs = conv(xs)
         if self.blstm is None:
             return xs.transpose(1, 2)
         if not isinstance(ilens, torch.Tensor):
             ilens = torch.tensor(ilens)
-        xs = pack_padded_sequence(xs.transpose(1, 2), ilens.cpu(), batch_first=True)
-        self.blstm.flatten_parameters()
+        ilens = ilens.cpu()
+        xs = xs.transpose(1, 2)
+        if getattr(self.blstm, "_is_replica", False):
+            # NOTE: DataParallel replicas hold broadcast copies of the weights,
+            #   which are not flattened by _apply
+            self.blstm.flatten_parameters()
+        if bool((ilens == xs.size(1)).all()):
+            # packing is not needed without padding, e.g. in inference
+            xs, _ = self.blstm(xs)  # (B, Tmax, C)
+            return xs, ilens
+        xs = pack_padded_sequence(xs, ilens, batch_first=True)
         xs, _ = self.blstm(xs)  # (B, Tmax, C)
         xs, hlens = pad_packed_sequence(xs, batch_first=True)
 
@@ -174,3 +192,12 @@ class Encoder(torch.nn.Module):
         ilens = torch.tensor([x.size(0)])
 
         return self.forward(xs, ilens)[0][0]
+
+    def fuse_conv_bn(self):
+        """Fold batch normalization into the convolution layers for inference.
+
+        The module must be in evaluation mode and cannot be trained afterwards.
+
+        """
+        if self.convs is not None:
+            fuse_conv_bn(self.convs)
@@ -4,10 +4,10 @@ from typing import List
 from typing import Tuple
 from typing import Union
 
-import editdistance
 import torch
 
 from espnet.nets.beam_search_transducer import BeamSearchTransducer
+from espnet.nets.e2e_asr_common import edit_distance
 from espnet.nets.pytorch_backend.transducer.custom_decoder import CustomDecoder
 from espnet.nets.pytorch_backend.transducer.joint_network import JointNetwork
 from espnet.nets.pytorch_backend.transducer.rnn_decoder import RNNDecoder
@@ -139,7 +139,7 @@ class ErrorCalculator(object):
             char_hyp = hyp.replace(" ", "")
             char_ref = refs[i].replace(" ", "")
 
-            distances.append(editdistance.eval(char_hyp, char_ref))
+            distances.append(edit_distance(char_hyp, char_ref))
             lens.append(len(char_ref))
 
         return float(sum(distances)) / sum(lens)
@@ -161,7 +161,7 @@ class ErrorCalculator(object):
             word_hyp = hyp.split()
             word_ref = refs[i].split()
 
-            distances.append(editdistance.eval(word_hyp, word_ref))
+            distances.append(edit_distance(word_hyp, word_ref))
             lens.append(len(word_ref))
 
         return float(sum(distances)) / sum(lens)
@@ -67,6 +67,9 @@ class Transformation(object):
             self.conf = {"mode": "sequential", "process": []}
 
         self.functions = OrderedDict()
+        # The parameters of each function, which are looked up once here
+        # because inspecting the signature is slow for every call
+        self.parameters = OrderedDict()
         if self.conf.get("mode", "sequential") == "sequential":
             for idx, process in enumerate(self.conf["process"]):
                 assert isinstance(process, dict), type(process)
@@ -89,6 +92,11 @@ class Transformation(object):
                             )
                         )
                     raise
+                try:
+                    self.parameters[idx] = signature(self.functions[idx]).parameters
+                except ValueError:
+                    # Some function, e.g. built-in function, are failed
+                    self.parameters[idx] = {}
         else:
             raise NotImplementedError(
                 "Not supporting mode={}".format(self.conf["mode"])
@@ -122,11 +130,7 @@ class Transformation(object):
                 func = self.functions[idx]
                 # TODO(karita): use TrainingTrans and UttTrans to check __call__ args
                 # Derive only the args which the func has
-                try:
-                    param = signature(func).parameters
-                except ValueError:
-                    # Some function, e.g. built-in function, are failed
-                    param = {}
+                param = self.parameters[idx]
                 _kwargs = {k: v for k, v in kwargs.items() if k in param}
                 try:
                     if uttid_list is not None and "uttid" in param:
@@ -1,27 +1,59 @@
 from nara_wpe.wpe import wpe
+import numpy as np
+
+try:
+    from espnet.transform.wpe_numba import wpe_numba
+except ImportError:
+    wpe_numba = None
+
+_warmed_up = False
 
 
 class WPE(object):
     def __init__(
-        self, taps=10, delay=3, iterations=3, psd_context=0, statistics_mode="full"
+        self,
+        taps=10,
+        delay=3,
+        iterations=3,
+        psd_context=0,
+        statistics_mode="full",
+        dtype="complex64",
     ):
         self.taps = taps
         self.delay = delay
         self.iterations = iterations
         self.psd_context = psd_context
         self.statistics_mode = statistics_mode
+        # single precision is sufficient for WPE and halves the memory traffic
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind != "c":
+            raise ValueError(f"dtype must be a complex type: {dtype}")
+
+        # Compile the numba kernel before the first real call. It is done once
+        # per process and synchronously so that the compiled kernel is inherited
+        # by forked DataLoader workers instead of being compiled in each of them.
+        global _warmed_up
+        if wpe_numba is not None and self.psd_context == 0 and not _warmed_up:
+            self._warm_up()
+            _warmed_up = True
+
+    def _warm_up(self):
+        # (F, C, T) with the same argument types as __call__
+        xs = np.zeros((1, 1, self.taps + self.delay + 2), dtype=self.dtype)
+        wpe_numba(xs, taps=self.taps, delay=self.delay, iterations=1, start=0)
 
     def __repr__(self):
         return (
             "{name}(taps={taps}, delay={delay}"
             "iterations={iterations}, psd_context={psd_context}, "
-            "statistics_mode={statistics_mode})".format(
+            "statistics_mode={statistics_mode}, dtype={dtype})".format(
                 name=self.__class__.__name__,
                 taps=self.taps,
                 delay=self.delay,
                 iterations=self.iterations,
                 psd_context=self.psd_context,
                 statistics_mode=self.statistics_mode,
+                dtype=self.dtype,
             )
         )
 
@@ -34,12 +66,28 @@ class WPE(object):
 
         """
         # nara_wpe.wpe: (F, C, T)
-        xs = wpe(
-            xs.transpose((2, 1, 0)),
-            taps=self.taps,
-            delay=self.delay,
-            iterations=self.iterations,
-            psd_context=self.psd_context,
-            statistics_mode=self.statistics_mode,
-        )
+        xs = np.ascontiguousarray(xs.astype(self.dtype, copy=False).transpose(2, 1, 0))
+        if wpe_numba is not None and self.psd_context == 0:
+            if self.statistics_mode == "full":
+                start = 0
+            elif self.statistics_mode == "valid":
+                start = self.delay + self.taps - 1
+            else:
+                raise ValueError(self.statistics_mode)
+            xs = wpe_numba(
+                xs,
+                taps=self.taps,
+                delay=self.delay,
+                iterations=self.iterations,
+                start=start,
+            )
+        else:
+            xs = wpe(
+                xs,
+                taps=self.taps,
+                delay=self.delay,
+                iterations=self.iterations,
+                psd_context=self.psd_context,
+                statistics_mode=self.statistics_mode,
+            )
         return xs.transpose(2, 1, 0)
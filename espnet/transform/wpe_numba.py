@@ -0,0 +1,71 @@
+"""Weighted prediction error dereverberation compiled with numba."""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def _build_y_tilde(Y, taps, delay):
+    """Stack the delayed observations of one frequency bin.
+
+    :param np.ndarray Y: (Channel, Time)
+    :return: (Taps * Channel, Time)
+    :rtype: np.ndarray
+    """
+    D, T = Y.shape
+    Y_tilde = np.zeros((taps * D, T), dtype=Y.dtype)
+    for k in range(taps):
+        shift = delay + k
+        if shift < T:
+            Y_tilde[k * D : (k + 1) * D, shift:] = Y[:, : T - shift]
+    return Y_tilde
+
+
+@numba.njit(cache=True)
+def _wpe_bin(Y, taps, delay, iterations, start):
+    """Dereverberate one frequency bin.
+
+    :param np.ndarray Y: (Channel, Time)
+    :param int start: first frame used to estimate the statistics
+    :return: (Channel, Time)
+    :rtype: np.ndarray
+    """
+    Y_tilde = _build_y_tilde(Y, taps, delay)
+    Y_tilde_s = np.ascontiguousarray(Y_tilde[:, start:])
+    Y_s_h = np.ascontiguousarray(Y[:, start:].T).conj()
+    Y_tilde_s_h = np.ascontiguousarray(Y_tilde_s.T).conj()
+    X = Y.copy()
+    for _ in range(iterations):
+        power = (X.real ** 2 + X.imag ** 2).sum(axis=0) / X.shape[0]
+        eps = 1e-10 * power.max()
+        if eps == 0:
+            inverse_power = np.ones_like(power)
+        else:
+            inverse_power = (1 / np.maximum(power, eps)).astype(power.dtype)
+        Y_tilde_inverse_power = Y_tilde_s * inverse_power[start:]
+        R = Y_tilde_inverse_power @ Y_tilde_s_h
+        P = Y_tilde_inverse_power @ Y_s_h
+        try:
+            G = np.linalg.solve(R, P)
+        except Exception:
+            G = np.linalg.lstsq(R, P)[0]
+        X = Y - np.ascontiguousarray(G.T).conj() @ Y_tilde
+    return X
+
+
+@numba.njit(parallel=True, cache=True)
+def wpe_numba(Y, taps=10, delay=3, iterations=3, start=0):
+    """Dereverberate the frequency bins in parallel.
+
+    This matches `nara_wpe.wpe.wpe` with psd_context=0.
+
+    :param np.ndarray Y: (Frequency, Channel, Time)
+    :param int start: first frame used to estimate the statistics,
+        i.e. 0 for the "full" and delay + taps - 1 for the "valid" mode
+    :return: (Frequency, Channel, Time)
+    :rtype: np.ndarray
+    """
+    X = np.empty_like(Y)
+    for f in numba.prange(Y.shape[0]):
+        X[f] = _wpe_bin(np.ascontiguousarray(Y[f]), taps, delay, iterations, start)
+    return X
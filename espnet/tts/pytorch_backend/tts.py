@@ -6,7 +6,9 @@
 
 """E2E-TTS training / decoding functions."""
 
+import contextlib
 import copy
+import functools
 import json
 import logging
 import math
@@ -588,10 +590,39 @@ def decode(args):
     torch_load(args.model, model)
     model.eval()
 
+    # NOTE: fused before the dynamic quantization, which doesn't touch convolutions
+    if args.fuse_conv_bn:
+        if not hasattr(model, "fuse_conv_bn"):
+            logging.warning(f"{model_class.__name__} does not support --fuse-conv-bn")
+        else:
+            logging.info("Fold batch normalization into the convolution layers")
+            model.fuse_conv_bn()
+
+    if args.quantize_tts_model:
+        if args.quantize_config is not None:
+            q_config = set([getattr(torch.nn, q) for q in args.quantize_config])
+        else:
+            q_config = {torch.nn.Linear, torch.nn.LSTM, torch.nn.LSTMCell}
+        logging.info("Use quantized tts model for decoding")
+
+        dtype = getattr(torch, args.quantize_dtype)
+        model = torch.quantization.quantize_dynamic(model, q_config, dtype=dtype)
+
     # set torch device
     device = torch.device("cuda" if args.ngpu > 0 else "cpu")
     model = model.to(device)
 
+    # the parameters are kept in float32 and the autocast region
+    # runs the matmuls and convolutions in the given precision
+    dtype = getattr(torch, args.dtype)
+    logging.info(f"Decoding device={device}, dtype={dtype}")
+    if dtype == torch.float32:
+        autocast = contextlib.nullcontext
+    elif hasattr(torch, "autocast"):
+        autocast = functools.partial(torch.autocast, device.type, dtype=dtype)
+    else:
+        raise ValueError(f"--dtype {args.dtype} requires pytorch>=1.10")
+
     # read json data
     with open(args.json, "rb") as f:
         js = json.load(f)["utts"]
@@ -709,7 +740,13 @@ def decode(args):
 
         # decode and write
         start_time = time.time()
-        outs, probs, att_ws = model.inference(x, args, spemb=spemb)
+        with autocast():
+            outs, probs, att_ws = model.inference(x, args, spemb=spemb)
+        outs = outs.float()
+        if probs is not None:
+            probs = probs.float()
+        if att_ws is not None:
+            att_ws = att_ws.float()
         logging.info(
             "inference speed = %.1f frames / sec."
             % (int(outs.size(0)) / (time.time() - start_time))
@@ -1,5 +1,7 @@
 from collections import OrderedDict
+import functools
 import io
+import json
 import logging
 import os
 
@@ -7,10 +9,38 @@ import h5py
 import kaldiio
 import numpy as np
 import soundfile
+import yaml
 
 from espnet.transform.transformation import Transformation
 
 
+@functools.lru_cache(maxsize=64)
+def _build_transformation(conf_json):
+    return Transformation(json.loads(conf_json))
+
+
+def load_transformation(preprocess_conf):
+    """Return Transformation shared in the process for the same configuration.
+
+    e.g. the loaders for training and validation data, which are usually
+    built from the same file, use a single instance and
+    the filter-banks or the cmvn statistics are created only once.
+
+    :param Union[str, dict] preprocess_conf: The path of a yaml file or a dict
+    :return: Transformation
+    """
+    if not isinstance(preprocess_conf, dict):
+        with io.open(preprocess_conf, encoding="utf-8") as f:
+            preprocess_conf = yaml.safe_load(f)
+        assert isinstance(preprocess_conf, dict), type(preprocess_conf)
+    try:
+        conf_json = json.dumps(preprocess_conf, sort_keys=True)
+    except TypeError:
+        # Not serializable values can't be the key of the cache
+        return Transformation(preprocess_conf)
+    return _build_transformation(conf_json)
+
+
 class LoadInputsAndTargets(object):
     """Create a mini-batch from a list of dicts
 
@@ -53,7 +83,7 @@ class LoadInputsAndTargets(object):
         if mode not in ["asr", "tts", "mt", "vc"]:
             raise ValueError("Only asr or tts are allowed: mode={}".format(mode))
         if preprocess_conf is not None:
-            self.preprocessing = Transformation(preprocess_conf)
+            self.preprocessing = load_transformation(preprocess_conf)
             logging.warning(
                 "[Experimental feature] Some preprocessing will be done "
                 "for the mini-batch creation using {}".format(self.preprocessing)
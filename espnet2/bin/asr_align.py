@@ -266,6 +266,12 @@ class CTCSegmentation:
         )
         # last token "<sos/eos>", not needed
         self.config.char_list = asr_model.token_list[:-1]
+        # the <unk> token is filtered out of the tokenized text of every file
+        self.unk_id = (
+            self.config.char_list.index("<unk>")
+            if "<unk>" in self.config.char_list
+            else None
+        )
 
     def set_config(self, **kwargs):
         """Set CTC segmentation parameters.
@@ -427,7 +433,9 @@ class CTCSegmentation:
         # Apply ctc layer to obtain log character probabilities
         lpz = self.ctc.log_softmax(enc).detach()
         #  Shape should be ( <time steps>, <classes> )
-        lpz = lpz.squeeze(0).cpu().numpy()
+        #  NOTE: converted to float32 once on the device, which is the dtype
+        #  used in the alignment, not to copy the posteriors in other dtypes
+        lpz = lpz.squeeze(0).float().cpu().numpy()
         return lpz
 
     def _split_text(self, text):
@@ -510,8 +518,8 @@ class CTCSegmentation:
                 self.preprocess_fn("<dummy>", {"text": utt})["text"] for utt in text
             ]
             # filter out any instances of the <unk> token
-            unk = config.char_list.index("<unk>")
-            token_list = [utt[utt != unk] for utt in token_list]
+            if self.unk_id is not None:
+                token_list = [utt[utt != self.unk_id] for utt in token_list]
             ground_truth_mat, utt_begin_indices = prepare_token_list(config, token_list)
         else:
             assert self.text_converter == "classic"
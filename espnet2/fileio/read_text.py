@@ -3,7 +3,9 @@ from pathlib import Path
 from typing import Dict
 from typing import List
 from typing import Union
+import warnings
 
+import numpy as np
 from typeguard import check_argument_types
 
 
@@ -70,6 +72,20 @@ def load_num_sequence_text(
     #            'uttb': np.ndarray([3, 4, 5])}
     d = read_2column_text(path)
 
+    # If all lines have the same number of columns, e.g. shape files,
+    # parse the numbers at once with numpy instead of calling int() for each
+    values = list(d.values())
+    ncols = {v.count(delimiter) + 1 for v in values}
+    if len(ncols) == 1:
+        ncol = ncols.pop()
+        with warnings.catch_warnings(record=True) as caught:
+            # fromstring stops at the first invalid number and only warns about it
+            warnings.simplefilter("always")
+            array = np.fromstring(delimiter.join(values), dtype=dtype, sep=delimiter)
+        # Fall back to the for-loop to parse or report the error for the invalid lines
+        if len(caught) == 0 and array.size == len(values) * ncol:
+            return dict(zip(d, array.reshape(len(values), ncol).tolist()))
+
     # Using for-loop instead of dict-comprehension for debuggability
     retval = {}
     for k, v in d.items():
@@ -79,3 +95,20 @@ def load_num_sequence_text(
             logging.error(f'Error happened with path="{path}", id="{k}", value="{v}"')
             raise
     return retval
+
+
+def load_lengths_text(path: Union[Path, str]) -> Dict[str, int]:
+    """Read only the first number of each line of a shape file.
+
+    Examples:
+        shape.txt:
+            key1 100,80
+            key2 230,80
+
+        >>> load_lengths_text('shape.txt')
+        {'key1': 100, 'key2': 230}
+
+    """
+    assert check_argument_types()
+    d = read_2column_text(path)
+    return dict(zip(d, map(int, (v.split(",", 1)[0] for v in d.values()))))
@@ -1,5 +1,9 @@
 import collections.abc
+import os
 from pathlib import Path
+import struct
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import numpy as np
@@ -9,6 +13,49 @@ from typeguard import check_argument_types
 from espnet2.fileio.read_text import read_2column_text
 
 
+def pcm16_wav_layout(path) -> Optional[Tuple[int, int, int, int]]:
+    """Find the sample data of a 16bit PCM RIFF/WAVE file.
+
+    Returns:
+        (offset, frames, channels, rate) or None if the file is not
+        a plain 16bit PCM wav file.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(12)
+            if len(header) != 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+                return None
+            fmt = None
+            while True:
+                chunk = f.read(8)
+                if len(chunk) != 8:
+                    return None
+                chunk_id, size = struct.unpack("<4sI", chunk)
+                if chunk_id == b"fmt ":
+                    fmt = struct.unpack("<HHIIHH", f.read(16))
+                    f.seek(size - 16 + (size & 1), os.SEEK_CUR)
+                elif chunk_id == b"data":
+                    offset = f.tell()
+                    break
+                else:
+                    f.seek(size + (size & 1), os.SEEK_CUR)
+            file_size = os.fstat(f.fileno()).st_size
+    except OSError:
+        return None
+
+    if fmt is None:
+        return None
+    format_tag, channels, rate, _, _, bits = fmt
+    # NOTE: Only WAVE_FORMAT_PCM is handled and
+    # the other formats, e.g. WAVE_FORMAT_EXTENSIBLE, fall back to soundfile
+    if format_tag != 1 or bits != 16 or channels == 0:
+        return None
+    frames = min(size, file_size - offset) // (2 * channels)
+    if frames == 0:
+        return None
+    return offset, frames, channels, rate
+
+
 class SoundScpReader(collections.abc.Mapping):
     """Reader class for 'wav.scp'.
 
@@ -22,6 +69,11 @@ class SoundScpReader(collections.abc.Mapping):
         >>> reader = SoundScpReader('wav.scp')
         >>> rate, array = reader['key1']
 
+    If use_memmap is True, 16bit PCM wav files are read through np.memmap
+    instead of being decoded by libsndfile. The position of the samples
+    is looked up once per key and reused in the following epochs.
+    The other formats, e.g. flac, are always read by soundfile.
+
     """
 
     def __init__(
@@ -30,16 +82,27 @@ class SoundScpReader(collections.abc.Mapping):
         dtype=np.int16,
         always_2d: bool = False,
         normalize: bool = False,
+        use_memmap: bool = False,
     ):
         assert check_argument_types()
         self.fname = fname
         self.dtype = dtype
         self.always_2d = always_2d
         self.normalize = normalize
+        self.use_memmap = use_memmap and (normalize or np.dtype(dtype) == np.int16)
         self.data = read_2column_text(fname)
+        # key -> (offset, frames, channels, rate) or None
+        self.layouts = {}
 
     def __getitem__(self, key):
         wav = self.data[key]
+        if self.use_memmap:
+            if key not in self.layouts:
+                self.layouts[key] = pcm16_wav_layout(wav)
+            layout = self.layouts[key]
+            if layout is not None:
+                return self._read_memmap(wav, *layout)
+
         if self.normalize:
             # soundfile.read normalizes data to [-1,1] if dtype is not given
             array, rate = soundfile.read(wav, always_2d=self.always_2d)
@@ -50,6 +113,19 @@ class SoundScpReader(collections.abc.Mapping):
 
         return rate, array
 
+    def _read_memmap(self, wav, offset, frames, channels, rate):
+        array = np.memmap(
+            wav, dtype="<i2", mode="r", offset=offset, shape=(frames, channels)
+        )
+        if channels == 1 and not self.always_2d:
+            array = array[:, 0]
+        if self.normalize:
+            # Same scaling as soundfile.read(wav, dtype="float64")
+            array = np.divide(array, 32768.0, out=np.empty(array.shape))
+        else:
+            array = np.array(array, dtype=np.int16)
+        return rate, array
+
     def get_path(self, key):
         return self.data[key]
 
@@ -8,6 +8,7 @@ import warnings
 
 import numpy as np
 import torch
+import torch.nn.functional as F
 
 from numba import njit
 from numba import prange
@@ -36,6 +37,11 @@ def maximum_path(neg_x_ent: torch.Tensor, attn_mask: torch.Tensor) -> torch.Tens
         Tensor: Maximum path tensor (B, T_feats, T_text).
 
     """
+    if neg_x_ent.is_cuda and neg_x_ent.size(1) >= 10000:
+        # NOTE: the torch version launches kernels for every frame, so it pays off
+        #   only for long inputs, which are expensive to copy to the host
+        return maximum_path_torch(neg_x_ent, attn_mask)
+
     device, dtype = neg_x_ent.device, neg_x_ent.dtype
     neg_x_ent = neg_x_ent.cpu().numpy().astype(np.float32)
     path = np.zeros(neg_x_ent.shape, dtype=np.int32)
@@ -49,6 +55,54 @@ def maximum_path(neg_x_ent: torch.Tensor, attn_mask: torch.Tensor) -> torch.Tens
     return torch.from_numpy(path).to(device=device, dtype=dtype)
 
 
+def maximum_path_torch(
+    neg_x_ent: torch.Tensor, attn_mask: torch.Tensor, max_neg_val: float = -1e9
+) -> torch.Tensor:
+    """Calculate batch maximum path with torch on the device of the inputs.
+
+    The recurrence over the frames is vectorized over the batch and the text.
+
+    Args:
+        neg_x_ent (Tensor): Negative X entropy tensor (B, T_feats, T_text).
+        attn_mask (Tensor): Attention mask (B, T_feats, T_text).
+        max_neg_val (float): Value of the unreachable transitions.
+
+    Returns:
+        Tensor: Maximum path tensor (B, T_feats, T_text).
+
+    """
+    value = neg_x_ent.float().clone()
+    t_ys = attn_mask.sum(1)[:, 0].long().unsqueeze(1)  # (B, 1)
+    t_xs = attn_mask.sum(2)[:, 0].long().unsqueeze(1)  # (B, 1)
+    xs = torch.arange(value.size(2), device=value.device).unsqueeze(0)  # (1, T_text)
+
+    for y in range(value.size(1)):
+        if y == 0:
+            v_cur = value.new_full(value[:, 0].size(), max_neg_val)
+            v_prev = F.pad(v_cur[:, :-1], (1, 0), value=0.0)
+        else:
+            v_cur = value[:, y - 1].masked_fill(xs == y, max_neg_val)
+            v_prev = F.pad(value[:, y - 1, :-1], (1, 0), value=max_neg_val)
+        mask = (xs >= t_xs + y - t_ys) & (xs < t_xs.clamp(max=y + 1)) & (y < t_ys)
+        value[:, y] = torch.where(
+            mask, value[:, y] + torch.max(v_prev, v_cur), value[:, y]
+        )
+
+    path = torch.zeros_like(value)
+    index = t_xs - 1  # (B, 1)
+    for y in range(value.size(1) - 1, -1, -1):
+        active = y < t_ys
+        path[:, y].scatter_(1, index, active.float())
+        if y == 0:
+            break
+        v_cur = value[:, y - 1].gather(1, index)
+        v_prev = value[:, y - 1].gather(1, (index - 1).clamp(min=0))
+        move = active & (index != 0) & ((index == y) | (v_cur < v_prev))
+        index = index - move.long()
+
+    return path.to(dtype=neg_x_ent.dtype)
+
+
 @njit
 def maximum_path_each_numba(path, value, t_y, t_x, max_neg_val=-np.inf):
     """Calculate a single maximum path with numba."""
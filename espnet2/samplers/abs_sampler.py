@@ -1,11 +1,28 @@
 from abc import ABC
 from abc import abstractmethod
+from typing import Dict
 from typing import Iterator
+from typing import List
 from typing import Tuple
 
+import numpy as np
 from torch.utils.data import Sampler
 
 
+def sort_keys_by_length(
+    utt2length: Dict[str, int], descending: bool = False
+) -> List[str]:
+    """Sort the keys by their lengths.
+
+    The sort is stable, i.e. keys with the same length keep their order.
+    """
+    keys = list(utt2length)
+    lengths = np.fromiter(utt2length.values(), dtype=np.int64, count=len(keys))
+    if descending:
+        lengths = -lengths
+    return [keys[i] for i in np.argsort(lengths, kind="stable")]
+
+
 class AbsSampler(Sampler, ABC):
     @abstractmethod
     def __len__(self) -> int:
@@ -0,0 +1,115 @@
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from typeguard import check_argument_types
+
+from espnet2.fileio.read_text import load_lengths_text
+from espnet2.samplers.abs_sampler import AbsSampler
+from espnet2.samplers.abs_sampler import sort_keys_by_length
+
+
+class BinBatchSampler(AbsSampler):
+    """Pack samples into mini-batches whose padded size fits in batch_bins.
+
+    The samples are visited in descending order of length and are appended
+    to the current mini-batch as long as
+        (batch_size + 1) x max_length <= batch_bins
+    holds, i.e. unlike LengthBatchSampler,
+    a mini-batch never exceeds batch_bins unless min_batch_size requires it.
+    """
+
+    def __init__(
+        self,
+        batch_bins: int,
+        shape_files: Union[Tuple[str, ...], List[str]],
+        min_batch_size: int = 1,
+        sort_in_batch: str = "descending",
+        sort_batch: str = "ascending",
+        drop_last: bool = False,
+    ):
+        assert check_argument_types()
+        assert batch_bins > 0
+        if sort_batch != "ascending" and sort_batch != "descending":
+            raise ValueError(
+                f"sort_batch must be ascending or descending: {sort_batch}"
+            )
+        if sort_in_batch != "descending" and sort_in_batch != "ascending":
+            raise ValueError(
+                f"sort_in_batch must be ascending or descending: {sort_in_batch}"
+            )
+
+        self.batch_bins = batch_bins
+        self.shape_files = shape_files
+        self.sort_in_batch = sort_in_batch
+        self.sort_batch = sort_batch
+        self.drop_last = drop_last
+
+        # utt2length: Only the first column of (Length, ...) is read
+        #    uttA 100,...
+        #    uttB 201,...
+        utt2lengths = [load_lengths_text(s) for s in shape_files]
+
+        first_utt2length = utt2lengths[0]
+        for s, d in zip(shape_files, utt2lengths):
+            if set(d) != set(first_utt2length):
+                raise RuntimeError(
+                    f"keys are mismatched between {s} != {shape_files[0]}"
+                )
+
+        # Sort samples in descending order
+        # (shape order should be like (Length, Dim))
+        keys = sort_keys_by_length(first_utt2length, descending=True)
+        if len(keys) == 0:
+            raise RuntimeError(f"0 lines found: {shape_files[0]}")
+
+        # Pack the samples from the longest one
+        self.batch_list = []
+        current_batch_keys = []
+        max_lengths = [0 for _ in utt2lengths]
+        for key in keys:
+            lengths = [max(m, sh[key]) for m, sh in zip(max_lengths, utt2lengths)]
+            # bins = (bs + 1) x max_length
+            bins = (len(current_batch_keys) + 1) * sum(lengths)
+            if bins > batch_bins and len(current_batch_keys) >= min_batch_size:
+                self.batch_list.append(tuple(current_batch_keys))
+                current_batch_keys = []
+                lengths = [sh[key] for sh in utt2lengths]
+            current_batch_keys.append(key)
+            max_lengths = lengths
+        else:
+            if len(current_batch_keys) != 0 and (
+                not self.drop_last or len(self.batch_list) == 0
+            ):
+                if (
+                    len(self.batch_list) > 0
+                    and len(current_batch_keys) < min_batch_size
+                ):
+                    # The remaining samples are merged into the last mini-batch
+                    current_batch_keys = (
+                        list(self.batch_list.pop(-1)) + current_batch_keys
+                    )
+                self.batch_list.append(tuple(current_batch_keys))
+
+        if sort_in_batch == "ascending":
+            self.batch_list = [b[::-1] for b in self.batch_list]
+
+        # The mini-batches are created in descending order
+        if sort_batch == "ascending":
+            self.batch_list.reverse()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"N-batch={len(self)}, "
+            f"batch_bins={self.batch_bins}, "
+            f"sort_in_batch={self.sort_in_batch}, "
+            f"sort_batch={self.sort_batch})"
+        )
+
+    def __len__(self):
+        return len(self.batch_list)
+
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
+        return iter(self.batch_list)
@@ -7,6 +7,7 @@ from typeguard import check_argument_types
 from typeguard import check_return_type
 
 from espnet2.samplers.abs_sampler import AbsSampler
+from espnet2.samplers.bin_batch_sampler import BinBatchSampler
 from espnet2.samplers.folded_batch_sampler import FoldedBatchSampler
 from espnet2.samplers.length_batch_sampler import LengthBatchSampler
 from espnet2.samplers.num_elements_batch_sampler import NumElementsBatchSampler
@@ -71,6 +72,11 @@ BATCH_TYPES = dict(
     "    utterance_id_a 1000,80\n"
     "    utterance_id_b 1453,80\n"
     "    utterance_id_c 1241,80\n",
+    batchbin="BinBatchSampler supports variable batch_size. "
+    "The samples are packed from the longest one into mini-batches "
+    "while 'batch_size x max_length' is not larger than batch_bins, "
+    "so a mini-batch doesn't exceed batch_bins unlike 'length'. "
+    "This samples requires length information as same as LengthBatchSampler\n",
 )
 
 
@@ -90,15 +96,16 @@ def build_batch_sampler(
     """Helper function to instantiate BatchSampler.
 
     Args:
-        type: mini-batch type. "unsorted", "sorted", "folded", "numel", or, "length"
+        type: mini-batch type. "unsorted", "sorted", "folded", "numel", "length",
+            or "batchbin"
         batch_size: The mini-batch size. Used for "unsorted", "sorted", "folded" mode
-        batch_bins: Used for "numel" model
+        batch_bins: Used for "numel", "length", or "batchbin" mode
         shape_files: Text files describing the length and dimension
             of each features. e.g. uttA 1330,80
         sort_in_batch:
         sort_batch:
         drop_last:
-        min_batch_size:  Used for "numel" or "folded" mode
+        min_batch_size:  Used for "numel", "length", "batchbin" or "folded" mode
         fold_lengths: Used for "folded" mode
         padding: Whether sequences are input as a padded tensor or not.
             used for "numel" mode
@@ -161,6 +168,16 @@ def build_batch_sampler(
             min_batch_size=min_batch_size,
         )
 
+    elif type == "batchbin":
+        retval = BinBatchSampler(
+            batch_bins=batch_bins,
+            shape_files=shape_files,
+            sort_in_batch=sort_in_batch,
+            sort_batch=sort_batch,
+            drop_last=drop_last,
+            min_batch_size=min_batch_size,
+        )
+
     else:
         raise ValueError(f"Not supported: {type}")
     assert check_return_type(retval)
@@ -6,9 +6,10 @@ from typing import Union
 
 from typeguard import check_argument_types
 
-from espnet2.fileio.read_text import load_num_sequence_text
+from espnet2.fileio.read_text import load_lengths_text
 from espnet2.fileio.read_text import read_2column_text
 from espnet2.samplers.abs_sampler import AbsSampler
+from espnet2.samplers.abs_sampler import sort_keys_by_length
 
 
 class FoldedBatchSampler(AbsSampler):
@@ -40,30 +41,28 @@ class FoldedBatchSampler(AbsSampler):
         self.sort_batch = sort_batch
         self.drop_last = drop_last
 
-        # utt2shape: (Length, ...)
+        # utt2length: Only the first column of (Length, ...) is read
         #    uttA 100,...
         #    uttB 201,...
-        utt2shapes = [
-            load_num_sequence_text(s, loader_type="csv_int") for s in shape_files
-        ]
+        utt2lengths = [load_lengths_text(s) for s in shape_files]
 
-        first_utt2shape = utt2shapes[0]
-        for s, d in zip(shape_files, utt2shapes):
-            if set(d) != set(first_utt2shape):
+        first_utt2length = utt2lengths[0]
+        for s, d in zip(shape_files, utt2lengths):
+            if set(d) != set(first_utt2length):
                 raise RuntimeError(
                     f"keys are mismatched between {s} != {shape_files[0]}"
                 )
 
         # Sort samples in ascending order
         # (shape order should be like (Length, Dim))
-        keys = sorted(first_utt2shape, key=lambda k: first_utt2shape[k][0])
+        keys = sort_keys_by_length(first_utt2length)
         if len(keys) == 0:
             raise RuntimeError(f"0 lines found: {shape_files[0]}")
 
         category2utt = {}
         if utt2category_file is not None:
             utt2category = read_2column_text(utt2category_file)
-            if set(utt2category) != set(first_utt2shape):
+            if set(utt2category) != set(first_utt2length):
                 raise RuntimeError(
                     "keys are mismatched between "
                     f"{utt2category_file} != {shape_files[0]}"
@@ -81,7 +80,7 @@ class FoldedBatchSampler(AbsSampler):
             batch_sizes = []
             while True:
                 k = category_keys[start]
-                factor = max(int(d[k][0] / m) for d, m in zip(utt2shapes, fold_lengths))
+                factor = max(int(d[k] / m) for d, m in zip(utt2lengths, fold_lengths))
                 bs = max(min_batch_size, int(batch_size / (1 + factor)))
                 if self.drop_last and start + bs > len(category_keys):
                     # This if-block avoids 0-batches
@@ -5,8 +5,9 @@ from typing import Union
 
 from typeguard import check_argument_types
 
-from espnet2.fileio.read_text import load_num_sequence_text
+from espnet2.fileio.read_text import load_lengths_text
 from espnet2.samplers.abs_sampler import AbsSampler
+from espnet2.samplers.abs_sampler import sort_keys_by_length
 
 
 class LengthBatchSampler(AbsSampler):
@@ -37,23 +38,21 @@ class LengthBatchSampler(AbsSampler):
         self.sort_batch = sort_batch
         self.drop_last = drop_last
 
-        # utt2shape: (Length, ...)
+        # utt2length: Only the first column of (Length, ...) is read
         #    uttA 100,...
         #    uttB 201,...
-        utt2shapes = [
-            load_num_sequence_text(s, loader_type="csv_int") for s in shape_files
-        ]
+        utt2lengths = [load_lengths_text(s) for s in shape_files]
 
-        first_utt2shape = utt2shapes[0]
-        for s, d in zip(shape_files, utt2shapes):
-            if set(d) != set(first_utt2shape):
+        first_utt2length = utt2lengths[0]
+        for s, d in zip(shape_files, utt2lengths):
+            if set(d) != set(first_utt2length):
                 raise RuntimeError(
                     f"keys are mismatched between {s} != {shape_files[0]}"
                 )
 
         # Sort samples in ascending order
         # (shape order should be like (Length, Dim))
-        keys = sorted(first_utt2shape, key=lambda k: first_utt2shape[k][0])
+        keys = sort_keys_by_length(first_utt2length)
         if len(keys) == 0:
             raise RuntimeError(f"0 lines found: {shape_files[0]}")
 
@@ -65,10 +64,10 @@ class LengthBatchSampler(AbsSampler):
             # shape: (Length, dim1, dim2, ...)
             if padding:
                 # bins = bs x max_length
-                bins = sum(len(current_batch_keys) * sh[key][0] for sh in utt2shapes)
+                bins = sum(len(current_batch_keys) * sh[key] for sh in utt2lengths)
             else:
                 # bins = sum of lengths
-                bins = sum(d[k][0] for k in current_batch_keys for d in utt2shapes)
+                bins = sum(d[k] for k in current_batch_keys for d in utt2lengths)
 
             if bins > batch_bins and len(current_batch_keys) >= min_batch_size:
                 batch_sizes.append(len(current_batch_keys))
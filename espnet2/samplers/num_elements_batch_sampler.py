@@ -8,6 +8,7 @@ from typeguard import check_argument_types
 
 from espnet2.fileio.read_text import load_num_sequence_text
 from espnet2.samplers.abs_sampler import AbsSampler
+from espnet2.samplers.abs_sampler import sort_keys_by_length
 
 
 class NumElementsBatchSampler(AbsSampler):
@@ -54,7 +55,7 @@ class NumElementsBatchSampler(AbsSampler):
 
         # Sort samples in ascending order
         # (shape order should be like (Length, Dim))
-        keys = sorted(first_utt2shape, key=lambda k: first_utt2shape[k][0])
+        keys = sort_keys_by_length({k: v[0] for k, v in first_utt2shape.items()})
         if len(keys) == 0:
             raise RuntimeError(f"0 lines found: {shape_files[0]}")
         if padding:
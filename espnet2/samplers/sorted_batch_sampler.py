@@ -4,8 +4,9 @@ from typing import Tuple
 
 from typeguard import check_argument_types
 
-from espnet2.fileio.read_text import load_num_sequence_text
+from espnet2.fileio.read_text import load_lengths_text
 from espnet2.samplers.abs_sampler import AbsSampler
+from espnet2.samplers.abs_sampler import sort_keys_by_length
 
 
 class SortedBatchSampler(AbsSampler):
@@ -34,16 +35,16 @@ class SortedBatchSampler(AbsSampler):
         self.sort_batch = sort_batch
         self.drop_last = drop_last
 
-        # utt2shape: (Length, ...)
+        # utt2length: Only the first column of (Length, ...) is read
         #    uttA 100,...
         #    uttB 201,...
-        utt2shape = load_num_sequence_text(shape_file, loader_type="csv_int")
+        utt2length = load_lengths_text(shape_file)
         if sort_in_batch == "descending":
             # Sort samples in descending order (required by RNN)
-            keys = sorted(utt2shape, key=lambda k: -utt2shape[k][0])
+            keys = sort_keys_by_length(utt2length, descending=True)
         elif sort_in_batch == "ascending":
             # Sort samples in ascending order
-            keys = sorted(utt2shape, key=lambda k: utt2shape[k][0])
+            keys = sort_keys_by_length(utt2length)
         else:
             raise ValueError(
                 f"sort_in_batch must be either one of "
@@ -58,7 +59,8 @@ class SortedBatchSampler(AbsSampler):
             # Split keys evenly as possible as. Note that If N != 1,
             # the these batches always have size of batch_size at minimum.
             self.batch_list = [
-                keys[i * len(keys) // N : (i + 1) * len(keys) // N] for i in range(N)
+                tuple(keys[i * len(keys) // N : (i + 1) * len(keys) // N])
+                for i in range(N)
             ]
         else:
             self.batch_list = [
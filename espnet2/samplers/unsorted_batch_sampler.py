@@ -65,8 +65,9 @@ class UnsortedBatchSampler(AbsSampler):
             if not self.drop_last:
                 # Split keys evenly as possible as. Note that If N != 1,
                 # the these batches always have size of batch_size at minimum.
+                n_keys = len(category_keys)
                 cur_batch_list = [
-                    category_keys[i * len(keys) // N : (i + 1) * len(keys) // N]
+                    tuple(category_keys[i * n_keys // N : (i + 1) * n_keys // N])
                     for i in range(N)
                 ]
             else:
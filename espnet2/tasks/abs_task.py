@@ -655,7 +655,8 @@ class AbsTask(ABC):
             "--batch_bins",
             type=int,
             default=1000000,
-            help="The number of batch bins. Used if batch_type='length' or 'numel'",
+            help="The number of batch bins. "
+            "Used if batch_type='length', 'numel' or 'batchbin'",
         )
         group.add_argument(
             "--valid_batch_bins",
@@ -41,12 +41,11 @@ def load_phns_emb_reorderring():
     
     mfa_vocab = ["<blank>","<unk>","AH0","T","N","sp","D","S","R","L","IH1","DH","AE1","M","EH1","K","Z","W","HH","ER0","AH1","IY1","P","V","F","B","AY1","IY0","EY1","AA1","AO1","UW1","IH0","OW1","NG","G","SH","ER1","Y","TH","AW1","CH","UH1","IH2","JH","OW0","EH2","OY1","AY2","EH0","EY2","UW0","AE2","AA2","OW2","AH2","ZH","AO2","IY2","AE0","UW2","AY0","AA0","AO0","AW2","EY0","UH2","ER2","OY2","UH0","AW0","OY0","<sos/eos>"]
     target_vocab = ["<blank>","<unk>","..","OY0","UH0","AW0","!","OY2","?","UH2","ER2","''","AA0","IY2","AW2","AY0","AH2","UW2","AE0","OW2","ZH","AO2","EY0","OY1","EH0","UW0","AA2","AY2","AE2","IH2","AO0","EY2","OW0","EH2","UH1","TH","AW1","Y","JH","CH","ER1","G","NG","SH","OW1",".","AY1","EY1","AO1","IY0","UW1","IY1","HH","B","AA1",",","F","ER0","V","AH1","AE1","P","W","EH1","M","IH0","IH1","Z","K","DH","L","R","S","D","T","N","AH0","<sos/eos>"]
+    # look up the phones in a table instead of scanning the vocabulary for each
+    mfa_index = {phn: i for i, phn in enumerate(mfa_vocab)}
     permutated_index = []
-    for i, phn in enumerate(target_vocab):
-        if phn in mfa_vocab:
-            permutated_index.append(mfa_vocab.index(phn))
-        else:
-            permutated_index.append(mfa_vocab.index("sp"))
+    for phn in target_vocab:
+        permutated_index.append(mfa_index.get(phn, mfa_index["sp"]))
     return permutated_index
 
 
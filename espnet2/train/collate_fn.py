@@ -9,7 +9,8 @@ import torch
 from typeguard import check_argument_types
 from typeguard import check_return_type
 import math
-from espnet.nets.pytorch_backend.nets_utils import pad_list, make_non_pad_mask
+from espnet.nets.pytorch_backend.nets_utils import make_non_pad_mask
+from espnet2.utils.typecheck import hot_path_typecheck
 
 class CommonCollateFn:
     """Functor class of common_collate_fn()"""
@@ -19,16 +20,19 @@ class CommonCollateFn:
         float_pad_value: Union[float, int] = 0.0,
         int_pad_value: int = -32768,
         not_sequence: Collection[str] = (),
+        sort_in_batch: bool = False,
     ):
         assert check_argument_types()
         self.float_pad_value = float_pad_value
         self.int_pad_value = int_pad_value
         self.not_sequence = set(not_sequence)
+        self.sort_in_batch = sort_in_batch
 
     def __repr__(self):
         return (
             f"{self.__class__}(float_pad_value={self.float_pad_value}, "
-            f"int_pad_value={self.float_pad_value})"
+            f"int_pad_value={self.float_pad_value}, "
+            f"sort_in_batch={self.sort_in_batch})"
         )
 
     def __call__(
@@ -39,6 +43,7 @@ class CommonCollateFn:
             float_pad_value=self.float_pad_value,
             int_pad_value=self.int_pad_value,
             not_sequence=self.not_sequence,
+            sort_in_batch=self.sort_in_batch,
         )
 
 
@@ -47,9 +52,14 @@ def common_collate_fn(
     float_pad_value: Union[float, int] = 0.0,
     int_pad_value: int = -32768,
     not_sequence: Collection[str] = (),
+    sort_in_batch: bool = False,
 ) -> Tuple[List[str], Dict[str, torch.Tensor]]:
     """Concatenate ndarray-list to an array and convert to torch.Tensor.
 
+    If sort_in_batch is True, the samples are sorted in descending order
+    of the length of the first item, e.g. for pack_padded_sequence(),
+    and the uttids are returned in the same order.
+
     Examples:
         >>> from espnet2.samplers.constant_batch_sampler import ConstantBatchSampler,
         >>> import espnet2.tasks.abs_task
@@ -65,41 +75,55 @@ def common_collate_fn(
         that of the dataset as they are.
 
     """
-    assert check_argument_types()
+    if hot_path_typecheck:
+        assert check_argument_types()
     uttids = [u for u, _ in data]
     data = [d for _, d in data]
 
-    assert all(set(data[0]) == set(d) for d in data), "dict-keys mismatching"
+    # dict.keys() can be compared as sets without building them for each sample
+    keys = data[0].keys()
+    assert all(d.keys() == keys for d in data), "dict-keys mismatching"
     assert all(
-        not k.endswith("_lengths") for k in data[0]
-    ), f"*_lengths is reserved: {list(data[0])}"
+        not k.endswith("_lengths") for k in keys
+    ), f"*_lengths is reserved: {list(keys)}"
+
+    if sort_in_batch:
+        first_key = next(iter(data[0]))
+        order = np.argsort(
+            [-d[first_key].shape[0] for d in data], kind="stable"
+        ).tolist()
+        uttids = [uttids[i] for i in order]
+        data = [data[i] for i in order]
 
     output = {}
     for key in data[0]:
         # NOTE(kamo):
         # Each models, which accepts these values finally, are responsible
         # to repaint the pad_value to the desired value for each tasks.
-        if data[0][key].dtype.kind == "i":
+        first = data[0][key]
+        if first.dtype.kind == "i":
             pad_value = int_pad_value
         else:
             pad_value = float_pad_value
 
-        array_list = [d[key] for d in data]
-
         # Assume the first axis is length:
-        # tensor_list: Batch x (Length, ...)
-        tensor_list = [torch.from_numpy(a) for a in array_list]
-        # tensor: (Batch, Length, ...)
-        tensor = pad_list(tensor_list, pad_value)
-        output[key] = tensor
+        # lens: (Batch,)
+        lens = [d[key].shape[0] for d in data]
+        # array: (Batch, Length, ...)
+        array = np.full(
+            (len(data), max(lens)) + first.shape[1:], pad_value, dtype=first.dtype
+        )
+        for i, d in enumerate(data):
+            array[i, : lens[i]] = d[key]
+        output[key] = torch.from_numpy(array)
 
         # lens: (Batch,)
         if key not in not_sequence:
-            lens = torch.tensor([d[key].shape[0] for d in data], dtype=torch.long)
-            output[key + "_lengths"] = lens
+            output[key + "_lengths"] = torch.tensor(lens, dtype=torch.long)
 
     output = (uttids, output)
-    assert check_return_type(output)
+    if hot_path_typecheck:
+        assert check_return_type(output)
     return output
 
 
@@ -209,7 +233,9 @@ def mlm_collate_fn(
         # tensor_list: Batch x (Length, ...)
         tensor_list = [torch.from_numpy(a) for a in array_list]
         # tensor: (Batch, Length, ...)
-        tensor = pad_list(tensor_list, pad_value)
+        tensor = torch.nn.utils.rnn.pad_sequence(
+            tensor_list, batch_first=True, padding_value=pad_value
+        )
         output[key] = tensor
 
         # lens: (Batch,)
@@ -31,6 +31,7 @@ from espnet2.fileio.read_text import read_2column_text
 from espnet2.fileio.rttm import RttmReader
 from espnet2.fileio.sound_scp import SoundScpReader
 from espnet2.utils.sized_dict import SizedDict
+from espnet2.utils.typecheck import hot_path_typecheck
 
 
 class AdapterForSoundScpReader(collections.abc.Mapping):
@@ -65,22 +66,25 @@ class AdapterForSoundScpReader(collections.abc.Mapping):
                     f"Unexpected type: {type(retval[0])}, {type(retval[1])}"
                 )
 
-            if self.rate is not None and self.rate != rate:
+            if self.rate is None:
+                self.rate = rate
+            elif self.rate != rate:
                 raise RuntimeError(
                     f"Sampling rates are mismatched: {self.rate} != {rate}"
                 )
-            self.rate = rate
             # Multichannel wave fie
             # array: (NSample, Channel) or (Nsample)
+            # NOTE: The channel-last layout from soundfile is kept as it is,
+            # so the array is C-contiguous and no transpose is needed here.
             if self.dtype is not None:
-                array = array.astype(self.dtype)
+                array = array.astype(self.dtype, copy=False)
 
         else:
             # Normal ark case
             assert isinstance(retval, np.ndarray), type(retval)
             array = retval
             if self.dtype is not None:
-                array = array.astype(self.dtype)
+                array = array.astype(self.dtype, copy=False)
 
         assert isinstance(array, np.ndarray), type(array)
         return array
@@ -113,7 +117,7 @@ def sound_loader(path, float_dtype=None):
     # NOTE(kamo): SoundScpReader doesn't support pipe-fashion
     # like Kaldi e.g. "cat a.wav |".
     # NOTE(kamo): The audio signal is normalized to [-1,1] range.
-    loader = SoundScpReader(path, normalize=True, always_2d=False)
+    loader = SoundScpReader(path, normalize=True, always_2d=False, use_memmap=True)
 
     # SoundScpReader.__getitem__() returns Tuple[int, ndarray],
     # but ndarray is desired, so Adapter class is inserted here
@@ -303,6 +307,9 @@ class ESPnetDataset(AbsDataset):
 
         self.float_dtype = float_dtype
         self.int_dtype = int_dtype
+        # Resolve the dtypes once instead of parsing them for every sample
+        self._float_np_dtype = np.dtype(float_dtype)
+        self._int_np_dtype = np.dtype(int_dtype)
         self.max_cache_fd = max_cache_fd
 
         self.loader_dict = {}
@@ -384,7 +391,8 @@ class ESPnetDataset(AbsDataset):
         return _mes
 
     def __getitem__(self, uid: Union[str, int]) -> Tuple[str, Dict[str, np.ndarray]]:
-        assert check_argument_types()
+        if hot_path_typecheck:
+            assert check_argument_types()
 
         # Change integer-id to string-id
         if isinstance(uid, int):
@@ -436,11 +444,11 @@ class ESPnetDataset(AbsDataset):
                     f'by preprocessing, but "{name}" is still {type(value)}.'
                 )
 
-            # Cast to desired type
+            # Cast to desired type, without copying if it already has the type
             if value.dtype.kind == "f":
-                value = value.astype(self.float_dtype)
+                value = value.astype(self._float_np_dtype, copy=False)
             elif value.dtype.kind == "i":
-                value = value.astype(self.int_dtype)
+                value = value.astype(self._int_np_dtype, copy=False)
             else:
                 raise NotImplementedError(f"Not supported dtype: {value.dtype}")
             data[name] = value
@@ -449,5 +457,6 @@ class ESPnetDataset(AbsDataset):
             self.cache[uid] = data
 
         retval = uid, data
-        assert check_return_type(retval)
+        if hot_path_typecheck:
+            assert check_return_type(retval)
         return retval
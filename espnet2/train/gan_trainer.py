@@ -145,7 +145,9 @@ class GANTrainer(Trainer):
                 if iterator_stop > 0:
                     break
 
-            batch = to_device(batch, "cuda" if ngpu > 0 else "cpu")
+            # The batches are pinned by DataLoader(pin_memory=True) if ngpu > 0,
+            # so they can be copied to GPU asynchronously
+            batch = to_device(batch, "cuda" if ngpu > 0 else "cpu", non_blocking=True)
             if no_forward_run:
                 all_steps_are_invalid = False
                 continue
@@ -345,7 +347,7 @@ class GANTrainer(Trainer):
                 if iterator_stop > 0:
                     break
 
-            batch = to_device(batch, "cuda" if ngpu > 0 else "cpu")
+            batch = to_device(batch, "cuda" if ngpu > 0 else "cpu", non_blocking=True)
             if no_forward_run:
                 continue
 
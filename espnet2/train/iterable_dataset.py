@@ -224,9 +224,9 @@ class IterableESPnetDataset(IterableDataset):
 
                 # Cast to desired type
                 if value.dtype.kind == "f":
-                    value = value.astype(self.float_dtype)
+                    value = value.astype(self.float_dtype, copy=False)
                 elif value.dtype.kind == "i":
-                    value = value.astype(self.int_dtype)
+                    value = value.astype(self.int_dtype, copy=False)
                 else:
                     raise NotImplementedError(f"Not supported dtype: {value.dtype}")
                 data[name] = value
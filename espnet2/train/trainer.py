@@ -535,7 +535,9 @@ class Trainer:
                 if iterator_stop > 0:
                     break
 
-            batch = to_device(batch, "cuda" if ngpu > 0 else "cpu")
+            # The batches are pinned by DataLoader(pin_memory=True) if ngpu > 0,
+            # so they can be copied to GPU asynchronously
+            batch = to_device(batch, "cuda" if ngpu > 0 else "cpu", non_blocking=True)
             if no_forward_run:
                 all_steps_are_invalid = False
                 continue
@@ -736,7 +738,7 @@ class Trainer:
                 if iterator_stop > 0:
                     break
 
-            batch = to_device(batch, "cuda" if ngpu > 0 else "cpu")
+            batch = to_device(batch, "cuda" if ngpu > 0 else "cpu", non_blocking=True)
             if no_forward_run:
                 continue
 
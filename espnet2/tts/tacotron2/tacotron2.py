@@ -321,9 +321,8 @@ class Tacotron2(AbsTTS):
         ys = feats
         olens = feats_lengths
 
-        # make labels for stop prediction
-        labels = make_pad_mask(olens - 1).to(ys.device, ys.dtype)
-        labels = F.pad(labels, [0, 1], "constant", 1.0)
+        # make labels for stop prediction on the device of the features
+        labels = make_pad_mask(olens - 1, ys[:, :, 0]).to(ys.dtype)
 
         # calculate tacotron2 outputs
         after_outs, before_outs, logits, att_ws = self._forward(
@@ -341,8 +340,8 @@ class Tacotron2(AbsTTS):
             assert olens.ge(
                 self.reduction_factor
             ).all(), "Output length must be greater than or equal to reduction factor."
-            olens = olens.new([olen - olen % self.reduction_factor for olen in olens])
-            max_out = max(olens)
+            olens = olens - olens % self.reduction_factor
+            max_out = int(olens.max())
             ys = ys[:, :max_out]
             labels = labels[:, :max_out]
             labels = torch.scatter(
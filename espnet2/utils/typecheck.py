@@ -0,0 +1,7 @@
+import os
+
+# NOTE: The type checks of typeguard inspect the annotations for every call.
+# The functions called for every sample or mini-batch, e.g.
+# ESPnetDataset.__getitem__() and common_collate_fn(), check their types
+# only if ESPNET_TYPECHECK=1 is set.
+hot_path_typecheck = os.environ.get("ESPNET_TYPECHECK", "0") not in ("", "0")
@@ -1,6 +1,7 @@
 from argparse import ArgumentParser
 from pathlib import Path
 import string
+import sys
 
 import numpy as np
 import pytest
@@ -17,7 +18,9 @@ def test_get_parser():
     assert isinstance(get_parser(), ArgumentParser)
 
 
-def test_main():
+def test_main(monkeypatch):
+    # not to parse the command line of pytest
+    monkeypatch.setattr(sys, "argv", ["asr_inference.py"])
     with pytest.raises(SystemExit):
         main()
 
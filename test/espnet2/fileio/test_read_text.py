@@ -3,6 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
+from espnet2.fileio.read_text import load_lengths_text
 from espnet2.fileio.read_text import load_num_sequence_text
 from espnet2.fileio.read_text import read_2column_text
 
@@ -52,3 +53,51 @@ def test_load_num_sequence_text_invalid(tmp_path: Path):
         f.write("abc 2 4\n")
     with pytest.raises(RuntimeError):
         load_num_sequence_text(p)
+
+
+@pytest.mark.parametrize(
+    "loader_type, value",
+    [
+        ("text_int", "1.5"),
+        ("text_int", "1e3"),
+        ("text_int", "12abc"),
+        ("csv_int", "3,4.9"),
+    ],
+)
+def test_load_num_sequence_text_invalid_last_value(
+    loader_type: str, value: str, tmp_path: Path
+):
+    p = tmp_path / "dummy.txt"
+    with p.open("w") as f:
+        f.write(f"abc {value}\n")
+    with pytest.raises(ValueError):
+        load_num_sequence_text(p, loader_type=loader_type)
+
+
+def test_load_num_sequence_text_python_float(tmp_path: Path):
+    p = tmp_path / "dummy.txt"
+    with p.open("w") as f:
+        f.write("abc 1_000\n")
+    target = load_num_sequence_text(p, loader_type="text_float")
+    assert target == {"abc": [1000.0]}
+
+
+@pytest.mark.parametrize("loader_type", ["text_int", "csv_float"])
+def test_load_num_sequence_text_ragged(loader_type: str, tmp_path: Path):
+    delimiter = "," if "csv" in loader_type else " "
+    p = tmp_path / "dummy.txt"
+    with p.open("w") as f:
+        f.write("abc " + delimiter.join(["0", "1", "2"]) + "\n")
+        f.write("def " + delimiter.join(["-3", "4"]) + "\n")
+
+    target = load_num_sequence_text(p, loader_type=loader_type)
+    assert target == {"abc": [0, 1, 2], "def": [-3, 4]}
+    assert all(isinstance(v, list) for v in target.values())
+
+
+def test_load_lengths_text(tmp_path: Path):
+    p = tmp_path / "shape.txt"
+    with p.open("w") as f:
+        f.write("abc 10,80\n")
+        f.write("def 3\n")
+    assert load_lengths_text(p) == {"abc": 10, "def": 3}
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
 import soundfile
 
 from espnet2.fileio.sound_scp import SoundScpReader
@@ -63,3 +64,42 @@ def test_SoundScpReader_normalize(tmp_path: Path):
         rate2, d = desired[k]
         assert rate1 == rate2
         np.testing.assert_array_equal(t, d)
+
+
+@pytest.mark.parametrize("normalize", [True, False])
+@pytest.mark.parametrize("always_2d", [True, False])
+@pytest.mark.parametrize("channels", [1, 2])
+@pytest.mark.parametrize("format", ["wav", "flac"])
+def test_SoundScpReader_use_memmap(
+    tmp_path: Path, normalize, always_2d, channels, format
+):
+    audio_path1 = tmp_path / f"a1.{format}"
+    audio1 = np.random.randint(-100, 100, (16, channels), dtype=np.int16)
+    audio_path2 = tmp_path / f"a2.{format}"
+    audio2 = np.random.randint(-100, 100, (16, channels), dtype=np.int16)
+
+    soundfile.write(audio_path1, audio1, 16)
+    soundfile.write(audio_path2, audio2, 16)
+
+    p = tmp_path / "dummy.scp"
+    with p.open("w") as f:
+        f.write(f"abc {audio_path1}\n")
+        f.write(f"def {audio_path2}\n")
+
+    desired = SoundScpReader(p, normalize=normalize, always_2d=always_2d)
+    target = SoundScpReader(
+        p, normalize=normalize, always_2d=always_2d, use_memmap=True
+    )
+
+    # Read twice to use the cached layouts
+    for _ in range(2):
+        for k in desired:
+            rate1, t = target[k]
+            rate2, d = desired[k]
+            assert rate1 == rate2
+            assert t.dtype == d.dtype
+            np.testing.assert_array_equal(t, d)
+    if format == "wav":
+        assert all(v is not None for v in target.layouts.values())
+    else:
+        assert all(v is None for v in target.layouts.values())
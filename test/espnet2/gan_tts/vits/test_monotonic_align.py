@@ -0,0 +1,29 @@
+"""Test VITS monotonic alignment search."""
+
+import numpy as np
+import pytest
+import torch
+
+from espnet2.gan_tts.vits.monotonic_align import maximum_path_numba
+from espnet2.gan_tts.vits.monotonic_align import maximum_path_torch
+
+
+@pytest.mark.parametrize(
+    "t_feats, t_text", [([10, 10, 10], [5, 5, 5]), ([12, 9, 4], [6, 9, 1])]
+)
+def test_maximum_path_torch(t_feats, t_text):
+    neg_x_ent = torch.randn(len(t_feats), max(t_feats), max(t_text))
+    attn_mask = torch.zeros_like(neg_x_ent)
+    for i, (t_y, t_x) in enumerate(zip(t_feats, t_text)):
+        attn_mask[i, :t_y, :t_x] = 1.0
+
+    path = np.zeros(neg_x_ent.shape, dtype=np.int32)
+    maximum_path_numba(
+        path,
+        neg_x_ent.numpy().copy(),
+        np.array(t_feats, dtype=np.int32),
+        np.array(t_text, dtype=np.int32),
+    )
+    torch.testing.assert_allclose(
+        maximum_path_torch(neg_x_ent, attn_mask), torch.from_numpy(path).float()
+    )
@@ -59,7 +59,7 @@ def test_SequenceIterFactory_deterministic(collate, num_iters_per_epoch):
     iter_factory = SequenceIterFactory(
         dataset=dataset,
         batches=batches,
-        num_iters_per_epoch=3,
+        num_iters_per_epoch=num_iters_per_epoch,
         shuffle=True,
         collate_fn=collate,
     )
@@ -67,3 +67,18 @@ def test_SequenceIterFactory_deterministic(collate, num_iters_per_epoch):
     for i in range(1, 10):
         for v, v2 in zip(iter_factory.build_iter(i), iter_factory.build_iter(i)):
             assert (v == v2).all()
+
+
+def test_SequenceIterFactory_reshuffle_every_epoch():
+    dataset = Dataset()
+    batches = [[i, i + 1] for i in range(0, 40, 2)]
+    iter_factory = SequenceIterFactory(
+        dataset=dataset, batches=batches, shuffle=True, collate_fn=collate_func
+    )
+
+    seq = [[it.tolist() for it in iter_factory.build_iter(i)] for i in range(1, 4)]
+    for s in seq:
+        assert sorted(s) == batches
+    assert seq[0] != seq[1] and seq[1] != seq[2]
+    # The given batches are not shuffled in place
+    assert batches == [[i, i + 1] for i in range(0, 40, 2)]
@@ -0,0 +1,65 @@
+import pytest
+
+from espnet2.samplers.bin_batch_sampler import BinBatchSampler
+
+
+@pytest.fixture()
+def shape_files(tmp_path):
+    p1 = tmp_path / "shape1.txt"
+    with p1.open("w") as f:
+        f.write("a 1000,80\n")
+        f.write("b 400,80\n")
+        f.write("c 800,80\n")
+        f.write("d 789,80\n")
+        f.write("e 1023,80\n")
+        f.write("f 999,80\n")
+
+    p2 = tmp_path / "shape2.txt"
+    with p2.open("w") as f:
+        f.write("a 30,30\n")
+        f.write("b 50,30\n")
+        f.write("c 39,30\n")
+        f.write("d 49,30\n")
+        f.write("e 44,30\n")
+        f.write("f 99,30\n")
+
+    return str(p1), str(p2)
+
+
+@pytest.mark.parametrize("sort_in_batch", ["descending", "ascending"])
+@pytest.mark.parametrize("sort_batch", ["descending", "ascending"])
+@pytest.mark.parametrize("drop_last", [True, False])
+def test_BinBatchSampler(shape_files, sort_in_batch, sort_batch, drop_last):
+    sampler = BinBatchSampler(
+        3000,
+        shape_files=shape_files,
+        sort_in_batch=sort_in_batch,
+        sort_batch=sort_batch,
+        drop_last=drop_last,
+    )
+    batches = list(sampler)
+    if not drop_last:
+        assert sorted(k for b in batches for k in b) == list("abcdef")
+    assert len(sampler) == len(batches)
+    print(sampler)
+
+
+def test_BinBatchSampler_not_exceed_batch_bins(shape_files):
+    sampler = BinBatchSampler(
+        3000,
+        shape_files=shape_files,
+        sort_batch="descending",
+    )
+    # e.g. (e, a): 2 x (1023 + 44) <= 3000 and (e, a, f): 3 x (1023 + 99) > 3000
+    assert list(sampler) == [("e", "a"), ("f", "c"), ("d", "b")]
+
+
+def test_BinBatchSampler_min_batch_size(shape_files):
+    sampler = BinBatchSampler(
+        3000,
+        shape_files=shape_files,
+        sort_batch="descending",
+        min_batch_size=4,
+    )
+    # The remaining (d, b) are merged into the last mini-batch
+    assert list(sampler) == [("e", "a", "f", "c", "d", "b")]
@@ -42,3 +42,13 @@ def test_UnsortedBatchSampler_repr(shape_files, drop_last):
 def test_UnsortedBatchSampler_len(shape_files, drop_last):
     sampler = UnsortedBatchSampler(2, key_file=shape_files[0], drop_last=drop_last)
     len(sampler)
+
+
+def test_UnsortedBatchSampler_with_category(shape_files, tmp_path):
+    utt2category = tmp_path / "utt2category"
+    with utt2category.open("w") as f:
+        f.write("a x\nb x\nc x\nd x\ne y\nf y\n")
+    sampler = UnsortedBatchSampler(
+        2, key_file=shape_files[0], utt2category_file=str(utt2category)
+    )
+    assert list(sampler) == [("a", "b"), ("c", "d"), ("e", "f")]
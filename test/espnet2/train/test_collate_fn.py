@@ -121,3 +121,15 @@ def test_CommonCollateFn_repr(float_pad_value, int_pad_value, not_sequence):
             not_sequence=not_sequence,
         )
     )
+
+
+def test_common_collate_fn_sort_in_batch():
+    data = [
+        ("id", dict(a=np.random.randn(2, 5))),
+        ("id2", dict(a=np.random.randn(4, 5))),
+        ("id3", dict(a=np.random.randn(3, 5))),
+    ]
+    uttids, t = common_collate_fn(data, sort_in_batch=True)
+    assert uttids == ["id2", "id3", "id"]
+    np.testing.assert_array_equal(t["a_lengths"], [4, 3, 2])
+    np.testing.assert_array_equal(t["a"][0], data[1][1]["a"])
@@ -0,0 +1,133 @@
+# coding: utf-8
+
+import argparse
+import json
+
+import numpy as np
+import pytest
+
+from espnet.asr.asr_utils import torch_save
+from espnet.nets.pytorch_backend.e2e_asr import E2E
+
+pytest.importorskip("ctc_segmentation")
+
+from espnet.bin.asr_align import ctc_align  # noqa: E402
+from espnet.bin.asr_align import get_parser  # noqa: E402
+
+
+def make_train_args(**kwargs):
+    train_defaults = dict(
+        elayers=1,
+        subsample="1_2",
+        etype="blstmp",
+        eunits=4,
+        eprojs=4,
+        dtype="lstm",
+        dlayers=1,
+        dunits=4,
+        atype="location",
+        aheads=1,
+        awin=2,
+        aconv_chans=1,
+        aconv_filts=2,
+        mtlalpha=1.0,
+        lsm_type="",
+        lsm_weight=0.0,
+        sampling_probability=0.0,
+        adim=4,
+        dropout_rate=0.0,
+        dropout_rate_decoder=0.0,
+        nbest=1,
+        beam_size=1,
+        penalty=0.0,
+        maxlenratio=1.0,
+        minlenratio=0.0,
+        ctc_weight=1.0,
+        lm_weight=0.0,
+        rnnlm=None,
+        verbose=0,
+        char_list=["<blank>", "a", "e", "i", "o", "u", "<eos>"],
+        outdir=None,
+        ctc_type="builtin",
+        report_cer=False,
+        report_wer=False,
+        sym_space="<space>",
+        sym_blank="<blank>",
+        replace_sos=False,
+        tgt_lang=False,
+        preprocess_conf=None,
+        model_module="espnet.nets.pytorch_backend.e2e_asr:E2E",
+    )
+    train_defaults.update(kwargs)
+
+    return argparse.Namespace(**train_defaults)
+
+
+@pytest.fixture()
+def align_inputs(tmp_path):
+    idim = 10
+    train_args = make_train_args()
+    odim = len(train_args.char_list)
+    model_path = tmp_path / "model.acc.best"
+    torch_save(str(model_path), E2E(idim, odim, train_args))
+    with (tmp_path / "model.json").open("wb") as f:
+        f.write(
+            json.dumps(
+                (idim, odim, vars(train_args)),
+                indent=4,
+                ensure_ascii=False,
+                sort_keys=True,
+            ).encode("utf_8")
+        )
+
+    utts = {}
+    with (tmp_path / "text").open("w", encoding="utf-8") as f:
+        for i in range(5):
+            name = f"rec{i}"
+            feat_path = tmp_path / f"{name}.npy"
+            np.save(feat_path, np.random.randn(200, idim).astype(np.float32))
+            utts[name] = {
+                "input": [
+                    {
+                        "feat": str(feat_path),
+                        "filetype": "npy",
+                        "name": "input1",
+                        "shape": [200, idim],
+                    }
+                ],
+                "output": [{"name": "target1", "shape": [3, odim], "tokenid": "1 2 3"}],
+            }
+            for j, utt in enumerate(["aei", "ou", "eia"]):
+                f.write(f"{name}_{j} {utt}\n")
+    with (tmp_path / "data.json").open("w", encoding="utf-8") as f:
+        json.dump({"utts": utts}, f)
+
+    return [
+        "--model",
+        str(model_path),
+        "--data-json",
+        str(tmp_path / "data.json"),
+        "--utt-text",
+        str(tmp_path / "text"),
+        "--subsampling-factor",
+        "2",
+        "--min-window-size",
+        "10",
+    ]
+
+
+def test_ctc_align_num_workers(align_inputs, tmp_path):
+    segments = []
+    for num_workers in [1, 2]:
+        output = tmp_path / f"segments.{num_workers}"
+        args = get_parser().parse_args(
+            align_inputs + ["--output", str(output), "--num-workers", str(num_workers)]
+        )
+        assert ctc_align(args, "cpu") == 0
+        args.output.close()
+        segments.append(output.read_text())
+
+    # the segments are written in the order of the audio files with any workers
+    assert segments[0] == segments[1]
+    utt_ids = [line.split()[0] for line in segments[0].splitlines()]
+    assert utt_ids == [f"rec{i}_{j}" for i in range(5) for j in range(3)]
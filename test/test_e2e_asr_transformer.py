@@ -260,3 +260,53 @@ def test_v0_3_transformer_input_compatibility():
     prefix = "decoder."
     rename_state_dict(prefix + "after_norm.", prefix + "output_norm.", state_dict)
     model.load_state_dict(state_dict)
+
+
+def test_chainer_transformer_decodable_in_float16():
+    args = make_arg()
+    model, x, ilens, y, data, uttid_list = prepare("chainer", args)
+    model.finalize_for_inference(dtype="float16")
+    assert model.decoder.embed.W.dtype == numpy.float16
+
+    recog_args = argparse.Namespace(
+        beam_size=2,
+        penalty=0.0,
+        ctc_weight=0.0,
+        maxlenratio=1.0,
+        lm_weight=0,
+        minlenratio=0,
+        nbest=2,
+    )
+    nbest = model.recognize(x[0, : ilens[0]], recog_args)
+    assert all(isinstance(h["score"], float) for h in nbest)
+
+
+@pytest.mark.parametrize("length", [1, 3])
+def test_ctc_prefix_batch_score(length):
+    from espnet.nets.ctc_prefix_score import CTCPrefixScore
+
+    rs = numpy.random.RandomState(0)
+    x = rs.randn(20, 6).astype(numpy.float32)
+    x -= numpy.log(numpy.exp(x).sum(axis=1, keepdims=True))
+    scorer = CTCPrefixScore(x, 0, 5, numpy)
+    ys = numpy.concatenate(
+        [numpy.full((3, 1), 5), rs.randint(1, 5, (3, length - 1))], axis=1
+    )
+    cs = numpy.stack([rs.permutation(6)[:4] for _ in range(3)])
+    states = []
+    for y in ys:
+        r = scorer.initial_state()
+        for n in range(1, length):
+            _, r = scorer(y[:n], y[n : n + 1], r)
+            r = r[0]
+        states.append(r)
+
+    scores, new_states = scorer.batch_score(ys, cs, numpy.stack(states))
+    for y, c, r, score, new_state in zip(ys, cs, states, scores, new_states):
+        ref_score, ref_state = scorer(y, c, r)
+        numpy.testing.assert_allclose(score, ref_score, rtol=1e-5)
+        # the frames before the prefix are left uninitialized
+        start = max(length - 2, 0)
+        numpy.testing.assert_allclose(
+            new_state[:, start:], ref_state[:, start:], rtol=1e-5
+        )
@@ -6,6 +6,8 @@
 from __future__ import print_function
 from __future__ import division
 
+import copy
+
 import numpy as np
 import pytest
 import torch
@@ -305,3 +307,122 @@ def test_tacotron2_multi_gpu_trainable(model_dict):
     optimizer.zero_grad()
     loss.backward()
     optimizer.step()
+
+
+def test_zoneout_cell():
+    from espnet.nets.pytorch_backend.tacotron2.decoder import ZoneOutCell
+
+    torch.manual_seed(0)
+    cell = ZoneOutCell(torch.nn.LSTMCell(4, 3), zoneout_rate=0.3)
+    xs = torch.randn(2, 4)
+    hidden = (torch.randn(2, 3), torch.randn(2, 3))
+    next_hidden = cell.cell(xs, hidden)
+
+    # eval mode takes the expectation of the zoneout mask
+    cell.eval()
+    for h, nh, zh in zip(hidden, next_hidden, cell(xs, hidden)):
+        torch.testing.assert_allclose(zh, 0.3 * h + 0.7 * nh)
+
+    # training mode keeps each unit either from the previous or the next state
+    cell.train()
+    for h, nh, zh in zip(hidden, next_hidden, cell(xs, hidden)):
+        assert torch.all((zh == h) | (zh == nh))
+
+
+def test_decoder_modules_scriptable():
+    from espnet.nets.pytorch_backend.tacotron2.decoder import LSTMStack
+    from espnet.nets.pytorch_backend.tacotron2.decoder import Prenet
+    from espnet.nets.pytorch_backend.tacotron2.decoder import ZoneOutCell
+
+    cell = ZoneOutCell(torch.nn.LSTMCell(4, 3), zoneout_rate=0.3).eval()
+    xs = torch.randn(2, 4)
+    hidden = (torch.randn(2, 3), torch.randn(2, 3))
+    for h, sh in zip(cell(xs, hidden), torch.jit.script(cell)(xs, hidden)):
+        torch.testing.assert_allclose(h, sh)
+
+    prenet = Prenet(4, n_layers=2, n_units=3, dropout_rate=0.0)
+    torch.testing.assert_allclose(prenet(xs), torch.jit.script(prenet)(xs))
+
+    lstm = LSTMStack([cell, torch.nn.LSTMCell(3, 3)])
+    z_list, c_list = [torch.randn(2, 3)] * 2, [torch.randn(2, 3)] * 2
+    outs = lstm(xs, z_list, c_list)
+    for hs, shs in zip(outs, torch.jit.script(lstm)(xs, z_list, c_list)):
+        for h, sh in zip(hs, shs):
+            torch.testing.assert_allclose(h, sh)
+
+
+@pytest.mark.parametrize("zoneout_rate", [0.0, 0.1])
+def test_tacotron2_quantized_decodable(zoneout_rate):
+    idim, odim = 5, 10
+    model_args = make_taco2_args(zoneout_rate=zoneout_rate)
+    model = Tacotron2(idim, odim, Namespace(**model_args)).eval()
+    model = torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear, torch.nn.LSTM, torch.nn.LSTMCell}, dtype=torch.qint8
+    )
+    with torch.no_grad():
+        x = torch.randint(0, idim, (7,))
+        model.inference(x, Namespace(**make_inference_args()))
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_tacotron2_fuse_conv_bn(quantize):
+    idim, odim = 5, 10
+    model_args = make_taco2_args(dropout_rate=0.0)
+    model = Tacotron2(idim, odim, Namespace(**model_args)).eval()
+    fused_model = copy.deepcopy(model)
+    # the batch normalization is folded before the quantization as in tts_decode
+    fused_model.fuse_conv_bn()
+    if quantize:
+        q_config = {torch.nn.Linear, torch.nn.LSTM, torch.nn.LSTMCell}
+        model = torch.quantization.quantize_dynamic(model, q_config, dtype=torch.qint8)
+        fused_model = torch.quantization.quantize_dynamic(
+            fused_model, q_config, dtype=torch.qint8
+        )
+    inference_args = Namespace(**make_inference_args())
+    x = torch.randint(0, idim, (7,))
+    with torch.no_grad():
+        outs = model.inference(x, inference_args)
+        fused_outs = fused_model.inference(x, inference_args)
+    assert not any(isinstance(m, torch.nn.BatchNorm1d) for m in fused_model.modules())
+    for out, fused_out in zip(outs, fused_outs):
+        torch.testing.assert_allclose(out, fused_out, rtol=1e-4, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "model_dict",
+    [
+        {},
+        {"reduction_factor": 3},
+        {"atype": "forward_ta"},
+        {"spk_embed_dim": 16},
+        {"use_cbhg": True, "spc_dim": 16},
+    ],
+)
+def test_tacotron2_batch_inference(model_dict):
+    idim, odim = 5, 10
+    model_args = make_taco2_args(dropout_rate=0.0, **model_dict)
+    model = Tacotron2(idim, odim, Namespace(**model_args)).eval()
+    inference_args = Namespace(**make_inference_args(maxlenratio=2.0))
+    spk_embed_dim = model_args["spk_embed_dim"]
+
+    with torch.no_grad():
+        # the decoder outputs match the ones of the sequences with various lengths
+        hs = torch.randn(3, 8, model.dec.idim)
+        hlens = torch.LongTensor([8, 6, 3])
+        batch_outs = model.dec.batch_inference(hs, hlens, maxlenratio=2.0)
+        for i, hlen in enumerate(hlens):
+            outs = model.dec.inference(hs[i, :hlen], maxlenratio=2.0)
+            for batch_out, out in zip(batch_outs, outs):
+                torch.testing.assert_allclose(batch_out[i], out, rtol=1e-3, atol=1e-4)
+
+        # the model outputs are returned in the order of the inputs
+        xs = torch.randint(1, idim, (3, 7))
+        spembs = torch.randn(3, spk_embed_dim) if spk_embed_dim is not None else None
+        batch_outs = model.batch_inference(
+            xs, torch.LongTensor([7, 7, 7]), inference_args, spembs
+        )
+        for i, x in enumerate(xs):
+            spemb = spembs[i] if spembs is not None else None
+            outs = model.inference(x, inference_args, spemb)
+            for batch_out, out in zip(batch_outs, outs):
+                torch.testing.assert_allclose(batch_out[i], out, rtol=1e-3, atol=1e-4)
@@ -0,0 +1,50 @@
+import pytest
+import torch
+
+from espnet.nets.pytorch_backend.nets_utils import fuse_conv_bn
+from espnet.nets.pytorch_backend.nets_utils import make_non_pad_mask
+from espnet.nets.pytorch_backend.nets_utils import make_pad_mask
+
+
+@pytest.mark.parametrize("lengths", [[5, 3, 2], torch.tensor([5, 3, 2])])
+def test_make_pad_mask(lengths):
+    desired = torch.tensor(
+        [[0, 0, 0, 0, 0], [0, 0, 0, 1, 1], [0, 0, 1, 1, 1]], dtype=torch.bool
+    )
+    assert make_pad_mask(lengths).dtype == torch.bool
+    assert torch.equal(make_pad_mask(lengths), desired)
+    assert torch.equal(make_non_pad_mask(lengths), ~desired)
+
+    # With the reference tensor
+    xs = torch.zeros(3, 2, 5)
+    assert torch.equal(make_pad_mask(lengths, xs), desired[:, None].expand_as(xs))
+    xs = torch.zeros(3, 5, 4)
+    assert torch.equal(make_pad_mask(lengths, xs, 1), desired[:, :, None].expand_as(xs))
+
+
+def test_fuse_conv_bn():
+    from espnet.nets.pytorch_backend.tacotron2.decoder import Postnet
+
+    torch.manual_seed(0)
+    postnet = Postnet(4, 3, n_layers=3, n_chans=5, n_filts=3)
+    # update the running statistics of the batch normalization layers
+    postnet(torch.randn(2, 3, 7))
+    postnet.eval()
+    xs = torch.randn(2, 3, 7)
+    ys = postnet(xs)
+
+    postnet.fuse_conv_bn()
+    assert not any(isinstance(m, torch.nn.BatchNorm1d) for m in postnet.modules())
+    torch.testing.assert_allclose(postnet(xs), ys)
+
+    with pytest.raises(RuntimeError):
+        fuse_conv_bn(postnet.postnet.train())
+
+
+def test_make_pad_mask_longer_than_cache():
+    lengths = [5000, 4097]
+    mask = make_pad_mask(lengths)
+    assert mask.shape == (2, 5000)
+    assert mask.sum().item() == 5000 - 4097
+    # the smaller masks are sliced from the grown cache
+    assert torch.equal(make_pad_mask([2, 1]), torch.tensor([[0, 0], [0, 1]]).bool())
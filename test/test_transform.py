@@ -1,5 +1,6 @@
 import kaldiio
 import numpy as np
+import pytest
 
 from espnet.transform.add_deltas import add_deltas
 from espnet.transform.cmvn import CMVN
@@ -100,3 +101,30 @@ def test_func_trans():
     assert parser._actions[2].option_strings == ["--foo-bar-b"]
     assert parser._actions[2].default == 2
     assert parser._actions[2].type == int
+
+
+@pytest.mark.parametrize("statistics_mode", ["full", "valid"])
+def test_wpe_numba(statistics_mode):
+    pytest.importorskip("numba")
+    from nara_wpe.wpe import wpe
+
+    from espnet.transform.wpe_numba import wpe_numba
+
+    xs = np.random.randn(5, 2, 50) + 1j * np.random.randn(5, 2, 50)
+    start = 0 if statistics_mode == "full" else 3 + 5 - 1
+    np.testing.assert_allclose(
+        wpe_numba(xs, taps=5, delay=3, iterations=3, start=start),
+        wpe(xs, taps=5, delay=3, iterations=3, statistics_mode=statistics_mode),
+        rtol=1e-6,
+    )
+
+
+@pytest.mark.parametrize("dtype", ["complex64", "complex128"])
+def test_wpe_dtype(dtype):
+    from espnet.transform.wpe import WPE
+
+    xs = np.random.randn(30, 2, 5) + 1j * np.random.randn(30, 2, 5)
+    assert WPE(taps=3, delay=1, dtype=dtype)(xs).dtype == np.dtype(dtype)
+
+    with pytest.raises(ValueError):
+        WPE(dtype="float32")
@@ -3,6 +3,7 @@ import h5py
 import kaldiio
 import numpy as np
 import pytest
+import yaml
 
 from espnet.utils.io_utils import LoadInputsAndTargets
 from espnet.utils.io_utils import SoundHDF5File
@@ -274,6 +275,17 @@ def test_error_calculator(tmpdir, typ):
         assert _wer is not None
 
 
+def test_error_calculator_ctc_value():
+    from espnet.nets.e2e_asr_common import ErrorCalculator
+
+    char_list = ["<blank>", "<space>", "a", "e"]
+    ec = ErrorCalculator(char_list, "<space>", "<blank>")
+    ys_hat = [np.array([2, 2, 0, 2, 3, 3, 1])]
+    ys_pad = [np.array([2, 3, -1])]
+    # "aae" vs. "ae"
+    assert ec(ys_hat, ys_pad, is_ctc=True) == 0.5
+
+
 def test_error_calculator_nospace(tmpdir):
     from espnet.nets.e2e_asr_common import ErrorCalculator
 
@@ -291,3 +303,25 @@ def test_error_calculator_nospace(tmpdir):
     assert cer_ctc_val is not None
     assert _cer is not None
     assert _wer is not None
+
+
+def test_load_inputs_and_targets_share_preprocessing(tmpdir):
+    conf = {
+        "process": [
+            {"type": "fbank", "n_mels": 2, "fs": 16000, "n_fft": 8, "n_shift": 4}
+        ]
+    }
+    p = tmpdir.join("preprocess.yaml")
+    p.write(yaml.safe_dump(conf))
+
+    load_tr = LoadInputsAndTargets(preprocess_conf=str(p))
+    load_cv = LoadInputsAndTargets(preprocess_conf=conf)
+    assert load_tr.preprocessing is load_cv.preprocessing
+
+    conf = {
+        "process": [
+            {"type": "fbank", "n_mels": 3, "fs": 16000, "n_fft": 8, "n_shift": 4}
+        ]
+    }
+    load_other = LoadInputsAndTargets(preprocess_conf=conf)
+    assert load_other.preprocessing is not load_tr.preprocessing